@@ -1,6 +1,8 @@
 """Album artwork embedding functionality."""
 
 import io
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 from mutagen.flac import FLAC, Picture
@@ -43,8 +45,14 @@ def find_cover_image(album_path: Path) -> Path | None:
         if cover_path.exists():
             return cover_path
 
-    # Case-insensitive fallback
-    files_lower = {f.name.lower(): f for f in album_path.iterdir() if f.is_file()}
+    # Case-insensitive fallback. scandir's DirEntry carries the file type
+    # from the directory read, so is_file() here avoids a stat per entry.
+    with os.scandir(album_path) as entries:
+        files_lower = {
+            entry.name.lower(): Path(entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+        }
     for filename in COVER_FILENAMES:
         if filename.lower() in files_lower:
             return files_lower[filename.lower()]
@@ -52,13 +60,83 @@ def find_cover_image(album_path: Path) -> Path | None:
     return None
 
 
+def _encode_jpeg(img: Image.Image, quality: int) -> bytes:
+    """Encode an image as JPEG at the given quality."""
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def _encode_jpeg_into(img: Image.Image, quality: int, buffer: io.BytesIO) -> int:
+    """Encode into buffer (rewound and truncated first) and return the size.
+
+    Unlike _encode_jpeg this never copies the result out of the buffer,
+    so probe encodes that turn out oversized cost no bytes allocation;
+    callers materialize a winner with buffer.getvalue().
+    """
+    buffer.seek(0)
+    buffer.truncate()
+    img.save(buffer, format="JPEG", quality=quality)
+    return buffer.tell()
+
+
+def _best_quality_encode(
+    img: Image.Image, max_size: int
+) -> tuple[bytes | None, int]:
+    """Encode as JPEG at the highest quality in [50, 95] that fits max_size.
+
+    JPEG output size grows monotonically (and roughly linearly) with
+    quality, so rather than binary-searching with up to 6 full encodes,
+    probe the endpoints and jump straight to the predicted best quality.
+    Only falls back to bisection when the prediction overshoots.
+
+    Returns:
+        Tuple of (data, q50_size): data is the JPEG bytes, or None if even
+        quality 50 exceeds max_size; q50_size is the size of the quality-50
+        probe (0 when the quality-95 encode already fit), which callers use
+        to predict target dimensions when the image must shrink.
+    """
+    buffer = io.BytesIO()
+
+    high_size = _encode_jpeg_into(img, 95, buffer)
+    if high_size <= max_size:
+        return buffer.getvalue(), 0
+
+    low_size = _encode_jpeg_into(img, 50, buffer)
+    if low_size > max_size:
+        return None, low_size
+    best_data = buffer.getvalue()
+
+    # Predict the quality that lands just under max_size
+    span = high_size - low_size
+    predicted = 50 + (max_size - low_size) * 45 // span if span > 0 else 50
+    predicted = min(94, max(51, predicted))
+
+    if _encode_jpeg_into(img, predicted, buffer) <= max_size:
+        return buffer.getvalue(), low_size
+
+    # Prediction overshot: bisect the remaining range below it
+    low, high = 51, predicted - 1
+    while low <= high:
+        mid = (low + high) // 2
+        if _encode_jpeg_into(img, mid, buffer) <= max_size:
+            best_data = buffer.getvalue()
+            low = mid + 1  # Try higher quality
+        else:
+            high = mid - 1  # Try lower quality
+
+    return best_data, low_size
+
+
 def resize_image_to_target(image_path: Path, max_size: int = MAX_IMAGE_SIZE) -> bytes:
     """Resize image to fit under max_size bytes.
 
     Strategy:
     1. Convert PNG to RGB for JPEG output
-    2. Binary search JPEG quality 95→50 to find largest quality under max_size
-    3. If quality 50 still too large: reduce dimensions by 10% and retry
+    2. Find the largest JPEG quality in 50-95 that fits under max_size
+       (predicted from probe encodes; see _best_quality_encode)
+    3. If quality 50 still too large: solve for the dimensions that fit
+       from the measured bytes-per-pixel rate and resize once
     4. Minimum dimensions: 500px to preserve usability
 
     Args:
@@ -69,66 +147,79 @@ def resize_image_to_target(image_path: Path, max_size: int = MAX_IMAGE_SIZE) ->
         JPEG image data as bytes.
     """
     img = Image.open(image_path)
+    is_jpeg = img.format == "JPEG"
 
-    # Convert to RGB if necessary (for PNG with transparency)
+    # Convert RGBA/P sources (PNG covers) for JPEG output. Converting
+    # straight to YCbCr drops alpha like an RGB convert would, but lets
+    # the JPEG encoder skip its internal RGB→YCbCr color-space pass —
+    # one fewer full traversal of the pixel data on these large images.
     if img.mode in ("RGBA", "P"):
-        img = img.convert("RGB")
+        img = img.convert("YCbCr")
 
     current_img = img
+    drafted = False
     while True:
-        # Binary search for optimal JPEG quality
-        low, high = 50, 95
-        best_data = None
-
-        while low <= high:
-            mid = (low + high) // 2
-            buffer = io.BytesIO()
-            current_img.save(buffer, format="JPEG", quality=mid)
-            data = buffer.getvalue()
-
-            if len(data) <= max_size:
-                best_data = data
-                low = mid + 1  # Try higher quality
-            else:
-                high = mid - 1  # Try lower quality
-
+        best_data, q50_size = _best_quality_encode(current_img, max_size)
         if best_data is not None:
             return best_data
 
-        # Quality 50 still too large, reduce dimensions by 10%
+        # Quality 50 still too large. JPEG size is roughly proportional
+        # to pixel count at fixed quality, so solve for the dimensions
+        # that land just under max_size (with 5% headroom) instead of
+        # shrinking 10% per iteration and re-searching.
         width, height = current_img.size
-        new_width = int(width * 0.9)
-        new_height = int(height * 0.9)
+        scale = (max_size / q50_size * 0.95) ** 0.5
+        new_width = int(width * scale)
+        new_height = int(height * scale)
 
-        # Check minimum dimensions
-        if new_width < MIN_DIMENSION or new_height < MIN_DIMENSION:
-            # Force minimum size and return whatever we get
+        # Below the minimum, force minimum size and return whatever we get
+        force_minimum = new_width < MIN_DIMENSION or new_height < MIN_DIMENSION
+        if force_minimum:
             if width > height:
                 new_width = MIN_DIMENSION
                 new_height = int(height * (MIN_DIMENSION / width))
             else:
                 new_height = MIN_DIMENSION
                 new_width = int(width * (MIN_DIMENSION / height))
-            current_img = current_img.resize((new_width, new_height), Image.LANCZOS)
-            buffer = io.BytesIO()
-            current_img.save(buffer, format="JPEG", quality=50)
-            return buffer.getvalue()
-
-        current_img = current_img.resize((new_width, new_height), Image.LANCZOS)
 
-
-def get_image_data(image_path: Path, max_size: int = MAX_IMAGE_SIZE) -> tuple[bytes, str]:
+        # Only now that the dimensions provably must shrink, let libjpeg
+        # downscale during decode: re-open and draft() to the target
+        # size. draft() shrinks in 1/2-1/8 steps and never below the
+        # requested size, so the LANCZOS resize starts from e.g. 1600px
+        # instead of 3200px — skipping the IDCT of coefficients the
+        # resize would discard anyway. Drafting to YCbCr (JPEG's native
+        # color space) also skips the decoder's YCbCr→RGB pass; the
+        # encoder accepts YCbCr directly. Covers that fit via quality
+        # reduction alone never get here and keep full resolution.
+        if is_jpeg and not drafted:
+            current_img = Image.open(image_path)
+            current_img.draft("YCbCr", (new_width, new_height))
+            drafted = True
+
+        current_img = current_img.resize(
+            (new_width, new_height), Image.LANCZOS, reducing_gap=2.0
+        )
+        if force_minimum:
+            return _encode_jpeg(current_img, 50)
+
+
+def get_image_data(
+    image_path: Path,
+    max_size: int = MAX_IMAGE_SIZE,
+    data: bytes | None = None,
+) -> tuple[bytes, str]:
     """Read image data, resizing if necessary.
 
     Args:
         image_path: Path to image file.
         max_size: Maximum size in bytes.
+        data: File contents, if the caller already read them.
 
     Returns:
         Tuple of (image_data, mime_type).
     """
-    # Read original file
-    original_data = image_path.read_bytes()
+    # Read original file (unless the caller did)
+    original_data = data if data is not None else image_path.read_bytes()
 
     if len(original_data) <= max_size:
         # Determine MIME type from extension
@@ -144,33 +235,57 @@ def get_image_data(image_path: Path, max_size: int = MAX_IMAGE_SIZE) -> tuple[by
     return resized_data, "image/jpeg"
 
 
-def embed_artwork_in_track(track_path: Path, image_data: bytes, mime_type: str) -> None:
-    """Embed artwork in a FLAC track.
-
-    Args:
-        track_path: Path to FLAC file.
-        image_data: Image data as bytes.
-        mime_type: MIME type of image (image/jpeg or image/png).
-    """
-    audio = FLAC(track_path)
-
-    # Create picture object
+def _build_picture(
+    image_data: bytes, mime_type: str, width: int, height: int
+) -> Picture:
+    """Build a FLAC front-cover Picture object."""
     picture = Picture()
     picture.type = 3  # Front cover
     picture.mime = mime_type
     picture.data = image_data
-
-    # Get image dimensions for metadata
-    img = Image.open(io.BytesIO(image_data))
-    picture.width, picture.height = img.size
+    picture.width = width
+    picture.height = height
     picture.depth = 24  # Assume 24-bit color
+    return picture
+
+
+def _embed_picture(track_path: Path, picture: Picture) -> None:
+    """Replace the embedded pictures in a FLAC file with the given one.
 
-    # Clear existing pictures and add new one
+    Pictures are serialized when the file is saved, so one Picture
+    instance can safely be shared across every track in an album.
+    """
+    audio = FLAC(track_path)
     audio.clear_pictures()
     audio.add_picture(picture)
     audio.save()
 
 
+def embed_artwork_in_track(
+    track_path: Path,
+    image_data: bytes,
+    mime_type: str,
+    width: int | None = None,
+    height: int | None = None,
+) -> None:
+    """Embed artwork in a FLAC track.
+
+    Args:
+        track_path: Path to FLAC file.
+        image_data: Image data as bytes.
+        mime_type: MIME type of image (image/jpeg or image/png).
+        width: Image width in pixels. Decoded from image_data if omitted.
+        height: Image height in pixels. Decoded from image_data if omitted.
+    """
+    # Get image dimensions for metadata (unless the caller already has them)
+    if width is None or height is None:
+        with Image.open(io.BytesIO(image_data)) as img:
+            width, height = img.size
+
+    picture = _build_picture(image_data, mime_type, width, height)
+    _embed_picture(track_path, picture)
+
+
 def embed_artwork(album_path: Path) -> dict:
     """Embed cover artwork in all FLAC files in an album.
 
@@ -202,17 +317,52 @@ def embed_artwork(album_path: Path) -> dict:
 
     result["cover_found"] = True
     result["cover_path"] = cover_path
-    result["original_size"] = cover_path.stat().st_size
+
+    # Read the cover once; its length doubles as the original size,
+    # avoiding both a separate stat() and a second read in get_image_data
+    original_data = cover_path.read_bytes()
+    result["original_size"] = len(original_data)
 
     # Get image data (with resizing if needed)
-    image_data, mime_type = get_image_data(cover_path)
+    image_data, mime_type = get_image_data(cover_path, data=original_data)
     result["embedded_size"] = len(image_data)
     result["was_resized"] = len(image_data) != result["original_size"]
 
-    # Find and process all FLAC files
+    # Decode dimensions and build the Picture once; every track embeds
+    # the same image, so per-track work is just the FLAC rewrite
+    with Image.open(io.BytesIO(image_data)) as img:
+        width, height = img.size
+    picture = _build_picture(image_data, mime_type, width, height)
+
+    # Find and process all FLAC files. Each embed is an independent
+    # read-modify-write dominated by file I/O, so run them concurrently.
     flac_files = sorted(album_path.glob("*.flac"))
-    for track_path in flac_files:
-        embed_artwork_in_track(track_path, image_data, mime_type)
-        result["tracks_processed"] += 1
+    if flac_files:
+        with ThreadPoolExecutor(max_workers=min(8, len(flac_files))) as executor:
+            list(executor.map(lambda p: _embed_picture(p, picture), flac_files))
+    result["tracks_processed"] = len(flac_files)
 
     return result
+
+
+def embed_artwork_many(
+    album_paths: list[Path], workers: int | None = None
+) -> list[dict]:
+    """Embed cover artwork across many albums in parallel.
+
+    Albums are independent and spend their time in image decode/encode
+    and FLAC rewrites, so they are farmed out to a process pool — the
+    right granularity for multi-album runs where per-track threading
+    alone leaves cores idle.
+
+    Args:
+        album_paths: Album directories to process.
+        workers: Number of worker processes. Defaults to the executor's
+            CPU-count default.
+
+    Returns:
+        List of embed_artwork result dicts, in input order.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # chunksize keeps pickling overhead from dominating on small albums
+        return list(executor.map(embed_artwork, album_paths, chunksize=4))
@@ -1,5 +1,12 @@
 """CLI entry point using Typer."""
 
+from __future__ import annotations
+
+import heapq
+import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -8,38 +15,30 @@ from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
 
-from .artwork import embed_artwork
-from .config import DOWNLOADS_PATH, LASTFM_API_KEY, LIBRARY_PATH, MUSIC_VOLUME, NEW_PATH
-from .convert import convert_album_to_aac
+from .config import DOWNLOADS_PATH, LIBRARY_PATH, MUSIC_VOLUME, NEW_PATH
 from .ignore import (
     add_ignored_album,
     add_ignored_artist,
     get_ignored_albums,
     get_ignored_artists,
-    is_album_ignored_with_variants,
     remove_ignored_album,
     remove_ignored_artist,
 )
-from .lastfm import rank_albums_by_popularity
 from .library import (
     check_volume_mounted,
-    find_matching_artist,
+    find_artist_with_suggestions,
     get_artist_path,
     normalize_artist,
     parse_album_folder,
     parse_new_folder,
-    scan_library,
+    scan_library_cached,
 )
 from .transfer import delete_source, move_album, rsync_album
-from .normalize import normalize_album
-from .qobuz import (
-    QobuzAlbum,
-    _normalize_album_title,
-    discover_missing_albums,
-    download_album,
-    preview_album_processing,
-    process_album,
-)
+
+# The qobuz, artwork, convert, normalize, and lastfm modules pull in
+# mutagen, Pillow, and httpx; they are imported inside the commands that
+# need them so `--help`, `scan`, and the transfer commands start without
+# paying for them. Annotations stay lazy via __future__ annotations.
 
 app = typer.Typer(
     name="music-librarian",
@@ -50,35 +49,87 @@ app.add_typer(ignore_app, name="ignore")
 
 console = Console()
 
+# Interactive input pattern, compiled once rather than per keystroke
+_TRANSFER_INPUT_RE = re.compile(r"(\d+)\s*([sprx])?")
+
+
+def _require_dir(path: Path, missing_msg: str, not_dir_msg: str) -> None:
+    """Exit with an error unless path is an existing directory.
+
+    A single stat answers both questions; the exists()/is_dir() pair
+    costs two syscalls — two network round-trips on a NAS path.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        console.print(f"[red]{missing_msg}[/red]")
+        raise typer.Exit(1)
+    if not stat.S_ISDIR(st.st_mode):
+        console.print(f"[red]{not_dir_msg}[/red]")
+        raise typer.Exit(1)
 
-def find_album_directories(path: Path) -> list[Path]:
-    """Find all album directories under a path.
+
+def iter_album_directories(path: Path, sort: bool = True):
+    """Yield album directories under a path lazily, in depth-first order.
 
     An album directory is identified by the naming pattern '[YYYY] Album Title'.
-    If the given path itself is an album directory, returns just that path.
-    Otherwise, recursively searches for album directories.
+    If the given path itself is an album directory, yields just that path.
+
+    Uses an explicit stack instead of recursion so the first album is
+    available before the whole tree has been walked — callers iterating
+    sequentially overlap their work with the directory scan.
 
     Args:
         path: Starting path to search from.
+        sort: Sort each directory's entries alphabetically. Pass False
+            when traversal order doesn't matter to skip the per-directory
+            sort entirely.
 
-    Returns:
-        List of album directory paths, sorted alphabetically.
+    Yields:
+        Album directory paths, in sorted depth-first order (directory
+        order when sort is False).
     """
     # Check if path itself is an album directory
     if parse_album_folder(path.name):
-        return [path]
-
-    # Recursively find album directories
-    albums = []
-    for item in sorted(path.iterdir()):
-        if item.is_dir():
-            if parse_album_folder(item.name):
-                albums.append(item)
-            else:
-                # Recurse into subdirectories (letter folders, artist folders)
-                albums.extend(find_album_directories(item))
+        yield path
+        return
 
-    return albums
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        if parse_album_folder(current.name):
+            yield current
+            continue
+
+        # scandir's DirEntry carries the file type from the directory
+        # read, so is_dir() here avoids a stat per entry — on a full
+        # library walk that halves the syscalls.
+        with os.scandir(current) as entries:
+            subdirs = [
+                entry for entry in entries if entry.is_dir(follow_symlinks=False)
+            ]
+
+        # Reverse-sorted push so pops come off in alphabetical order
+        if sort:
+            subdirs.sort(key=lambda e: e.name, reverse=True)
+        for entry in subdirs:
+            stack.append(Path(entry.path))
+
+
+def find_album_directories(path: Path, sort: bool = True) -> list[Path]:
+    """Find all album directories under a path.
+
+    List-returning wrapper around iter_album_directories for callers
+    that need the count up front.
+
+    Args:
+        path: Starting path to search from.
+        sort: Sort entries alphabetically (see iter_album_directories).
+
+    Returns:
+        List of album directory paths, sorted alphabetically.
+    """
+    return list(iter_album_directories(path, sort=sort))
 
 
 @app.command()
@@ -87,15 +138,21 @@ def scan(
         Optional[Path],
         typer.Option("--path", "-p", help="Path to music library"),
     ] = None,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Bypass the scan cache and rescan"),
+    ] = False,
 ) -> None:
     """List all artists and albums in the library."""
     path = library_path or LIBRARY_PATH
 
-    if not path.exists():
-        console.print(f"[red]Library path does not exist: {path}[/red]")
-        raise typer.Exit(1)
+    _require_dir(
+        path,
+        f"Library path does not exist: {path}",
+        f"Library path is not a directory: {path}",
+    )
 
-    artists = scan_library(path)
+    artists = scan_library_cached(path, refresh=refresh)
 
     if not artists:
         console.print("[yellow]No artists found in library.[/yellow]")
@@ -105,7 +162,7 @@ def scan(
     table.add_column("Artist", style="cyan")
     table.add_column("Albums", style="green")
 
-    for artist in sorted(artists.values(), key=lambda a: a.name.lower()):
+    for artist in artists.values():
         album_list = ", ".join(
             f"[{a.year}] {a.title}" for a in sorted(artist.albums, key=lambda x: x.year)
         )
@@ -123,46 +180,67 @@ def _open_in_qobuz(album_id: str) -> None:
     subprocess.Popen(["open", url])
 
 
-def _parse_interactive_input(choice: str, max_idx: int) -> list[tuple[int, str]]:
+def _parse_interactive_input(
+    choice: str, max_idx: int
+) -> tuple[bool, list[tuple[int, str]]]:
     """Parse interactive discover input.
 
     Supports:
     - Single index: "2" (select), "2d" (download), "2i" (ignore), "2o" (open), "2s" (skip)
     - Range: "1-3d" (download 1, 2, 3), "1-3i" (ignore 1, 2, 3)
-    - Action only: "d", "i", "o", "s", "q"
+    - Quit: "q"
 
-    Returns list of (index, action) tuples. Index is 0 for action-only commands.
+    Returns (quit, actions): quit is True for the "q" command, actions is
+    a list of (index, action) tuples (empty for quit or invalid input).
     """
     choice = choice.strip().lower()
 
     if not choice:
-        return []
+        return False, []
 
     if choice == "q":
-        return [(0, "q")]
-
-    # Parse range with action: "1-3d" or "1-3 d"
-    import re
-    range_match = re.match(r"(\d+)\s*-\s*(\d+)\s*([dios])?", choice)
-    if range_match:
-        start, end, action = range_match.groups()
-        start_idx, end_idx = int(start), int(end)
+        return True, []
+
+    # The grammar is just \d+(-\d+)?[dios]? with optional spaces, so a
+    # hand-rolled scan beats two regex attempts with match-object and
+    # group allocations on every keystroke
+    n = len(choice)
+
+    def _read_int(i: int) -> tuple[int | None, int]:
+        # Explicit ASCII range, not isdigit(): isdigit() accepts
+        # characters like "²" that int() then rejects
+        start = i
+        while i < n and "0" <= choice[i] <= "9":
+            i += 1
+        return (int(choice[start:i]) if i > start else None), i
+
+    def _skip_spaces(i: int) -> int:
+        while i < n and choice[i] == " ":
+            i += 1
+        return i
+
+    start_idx, i = _read_int(0)
+    if start_idx is None:
+        return False, []
+    i = _skip_spaces(i)
+
+    end_idx = None
+    if i < n and choice[i] == "-":
+        end_idx, i = _read_int(_skip_spaces(i + 1))
+        if end_idx is None:
+            return False, []
+        i = _skip_spaces(i)
+
+    action = choice[i] if i < n and choice[i] in "dios" else "s"
+
+    if end_idx is not None:
         if start_idx < 1 or end_idx > max_idx or start_idx > end_idx:
-            return []
-        action = action or "s"  # Default to select/skip
-        return [(i, action) for i in range(start_idx, end_idx + 1)]
-
-    # Parse single index with optional action: "2", "2d", "2 d"
-    single_match = re.match(r"(\d+)\s*([dios])?", choice)
-    if single_match:
-        idx, action = single_match.groups()
-        idx = int(idx)
-        if idx < 1 or idx > max_idx:
-            return []
-        action = action or "s"  # Default to select/skip
-        return [(idx, action)]
+            return False, []
+        return False, [(j, action) for j in range(start_idx, end_idx + 1)]
 
-    return []
+    if start_idx < 1 or start_idx > max_idx:
+        return False, []
+    return False, [(start_idx, action)]
 
 
 def _interactive_discover(
@@ -172,30 +250,33 @@ def _interactive_discover(
     cons: Console,
 ) -> None:
     """Interactive album selection for discover command."""
+    from .qobuz import download_album
+
     # Sort by year for display
     albums = sorted(albums, key=lambda x: x.year)
 
     while albums:
-        # Display numbered list
-        cons.print(f"\n[bold]Albums for {canonical_name} ({len(albums)}):[/bold]")
+        # Build the numbered list as one block: each console.print pays
+        # Rich's full markup/render pipeline, so emit it in a single call
+        lines = [f"\n[bold]Albums for {canonical_name} ({len(albums)}):[/bold]"]
         for i, album in enumerate(albums, 1):
             fidelity = f"{album.bit_depth}bit/{album.sample_rate}kHz"
             if album.standard_id:
                 # Merged album - will be trimmed to standard track count
-                cons.print(
+                lines.append(
                     f"  [bold]{i}.[/bold] [{album.year}] {album.title} "
                     f"[dim]({fidelity}, [/dim][magenta]{album.standard_track_count} tracks, trimmed[/magenta][dim])[/dim]"
                 )
             else:
-                cons.print(
+                lines.append(
                     f"  [bold]{i}.[/bold] [{album.year}] {album.title} "
                     f"[dim]({fidelity}, {album.tracks_count} tracks)[/dim]"
                 )
-
-        cons.print(
+        lines.append(
             "\n[dim]Enter: number + action (e.g., '2d' download, '3i' ignore, '1o' open in Qobuz), "
             "or 'q' to quit[/dim]"
         )
+        cons.print("\n".join(lines))
 
         # Get input
         try:
@@ -203,15 +284,13 @@ def _interactive_discover(
         except (KeyboardInterrupt, EOFError):
             break
 
-        parsed = _parse_interactive_input(choice, len(albums))
+        is_quit, parsed = _parse_interactive_input(choice, len(albums))
+        if is_quit:
+            break
         if not parsed:
             cons.print("[yellow]Invalid input. Try again.[/yellow]")
             continue
 
-        # Check for quit
-        if parsed[0][1] == "q":
-            break
-
         # Process actions in reverse order (so indices remain valid after removal)
         removed_indices = set()
         for idx, action in sorted(parsed, key=lambda x: -x[0]):
@@ -246,8 +325,10 @@ def _interactive_discover(
 
             # "s" (skip) does nothing
 
-        # Remove processed albums
-        albums = [a for i, a in enumerate(albums) if i not in removed_indices]
+        # Remove processed albums in place, highest index first so the
+        # remaining indices stay valid — no full-list rebuild per batch
+        for i in sorted(removed_indices, reverse=True):
+            del albums[i]
 
 
 @app.command()
@@ -268,15 +349,23 @@ def discover(
         bool,
         typer.Option("--interactive", "-I", help="Interactive mode to download or ignore albums"),
     ] = False,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Bypass the scan cache and rescan"),
+    ] = False,
 ) -> None:
     """Find new albums by artists in the library."""
+    from .qobuz import discover_missing_albums
+
     path = library_path or LIBRARY_PATH
 
-    if not path.exists():
-        console.print(f"[red]Library path does not exist: {path}[/red]")
-        raise typer.Exit(1)
+    _require_dir(
+        path,
+        f"Library path does not exist: {path}",
+        f"Library path is not a directory: {path}",
+    )
 
-    artists = scan_library(path)
+    artists = scan_library_cached(path, refresh=refresh)
 
     if not artists:
         console.print("[yellow]No artists found in library.[/yellow]")
@@ -286,46 +375,118 @@ def discover(
     if artist:
         normalized = normalize_artist(artist)
         if normalized not in artists:
-            # Try fuzzy match
-            match = find_matching_artist(artist, list(artists.keys()))
+            # Try fuzzy match; one pass scores the match and suggestions
+            match, suggestions = find_artist_with_suggestions(artist, artists.keys())
             if match:
                 console.print(f"[dim]Matched '{artist}' to '{match}'[/dim]")
                 normalized = match
             else:
                 console.print(f"[yellow]Artist '{artist}' not found in library.[/yellow]")
-                # Suggest closest matches
-                from rapidfuzz import process as rfprocess
-                suggestions = rfprocess.extract(artist, list(artists.keys()), limit=3)
                 if suggestions:
                     console.print("[dim]Did you mean:[/dim]")
-                    for name, score, _ in suggestions:
+                    for name in suggestions:
                         console.print(f"  [dim]- {name}[/dim]")
                 return
         artists = {normalized: artists[normalized]}
 
-    from .ignore import is_artist_ignored
+    # Snapshot the ignore list once: the is_artist_ignored /
+    # is_album_ignored_with_variants helpers re-read the JSON file on
+    # every call, which this loop would otherwise do per artist and album
+    ignored_artists = {a.lower() for a in get_ignored_artists()}
+    ignored_albums = {
+        (e["artist"].lower(), e["album"].lower()) for e in get_ignored_albums()
+    }
+
+    # Ignored titles per artist, computed on first check: the artist name
+    # variants only depend on the artist, so building this set once turns
+    # the per-album check into one or two hash lookups instead of probing
+    # every (variant, title) pair
+    ignored_titles_by_artist: dict[str, frozenset[str]] = {}
+
+    def _album_ignored(artist_data, album) -> bool:
+        """Same variant matching as is_album_ignored_with_variants, as set lookups."""
+        titles = ignored_titles_by_artist.get(artist_data.name)
+        if titles is None:
+            canonical_lower = artist_data.canonical_name.lower()
+            artist_variants = {
+                artist_data.lower_name,
+                canonical_lower,
+                f"the {canonical_lower}",
+            }
+            titles = frozenset(
+                t for a, t in ignored_albums if a in artist_variants
+            )
+            ignored_titles_by_artist[artist_data.name] = titles
+        if not titles:
+            return False
+        # album is a QobuzAlbum here, not a library Album — no lower_title
+        return (
+            album.title.lower() in titles
+            or album.normalized_title in titles
+        )
 
-    for artist_data in sorted(artists.values(), key=lambda a: a.name.lower()):
-        # Skip ignored artists
-        if is_artist_ignored(artist_data.canonical_name) or is_artist_ignored(artist_data.name):
-            continue
+    # scan_library already returns artists in display order
+    candidates = [
+        a
+        for a in artists.values()
+        if a.canonical_name.lower() not in ignored_artists
+        and a.lower_name not in ignored_artists
+    ]
+
+    # Checking an artist is network-bound (two Qobuz round-trips), so in
+    # non-interactive mode fan the fetches out across a small thread pool
+    # and render results in library order as they resolve. Interactive
+    # mode stays serial — it prompts between artists.
+    futures = {}
+    executor = None
+    if not interactive and len(candidates) > 1:
+        executor = ThreadPoolExecutor(max_workers=min(8, len(candidates)))
+        for artist_data in candidates:
+            existing = [(a.year, a.title) for a in artist_data.albums]
+            futures[artist_data.name] = executor.submit(
+                discover_missing_albums, artist_data.canonical_name, existing
+            )
 
-        console.print(f"\n[cyan]Checking {artist_data.canonical_name}...[/cyan]")
+    try:
+        _discover_loop(candidates, futures, all_albums, interactive, _album_ignored)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _format_album_line(album) -> str:
+    """Pre-render one discover result line as Rich markup."""
+    fidelity = f"{album.bit_depth}bit/{album.sample_rate}kHz"
+    if album.standard_id:
+        # This is a hi-fi version that will have bonus tracks removed
+        return (
+            f"    [{album.year}] {album.title} "
+            f"[magenta]({fidelity}, {album.standard_track_count} tracks)[/magenta] "
+            f"[dim]id:{album.id}[/dim]"
+        )
+    return (
+        f"    [{album.year}] {album.title} [dim]({fidelity})[/dim] "
+        f"[dim]id:{album.id}[/dim]"
+    )
 
-        existing = [(a.year, a.title) for a in artist_data.albums]
+
+def _discover_loop(candidates, futures, all_albums, interactive, _album_ignored):
+    """Render discover results for each artist, in order."""
+    from .qobuz import discover_missing_albums
+
+    for artist_data in candidates:
+        console.print(f"\n[cyan]Checking {artist_data.canonical_name}...[/cyan]")
 
         try:
-            missing = discover_missing_albums(artist_data.canonical_name, existing)
+            if artist_data.name in futures:
+                missing = futures[artist_data.name].result()
+            else:
+                existing = [(a.year, a.title) for a in artist_data.albums]
+                missing = discover_missing_albums(artist_data.canonical_name, existing)
 
             # Filter out ignored albums
             missing = [
-                album for album in missing
-                if not is_album_ignored_with_variants(
-                    artist_data.name,
-                    artist_data.canonical_name,
-                    album.title,
-                    _normalize_album_title(album.title),
-                )
+                album for album in missing if not _album_ignored(artist_data, album)
             ]
 
             if missing:
@@ -343,37 +504,26 @@ def discover(
 
                     # Rank and limit if more than 3 albums and not showing all
                     if total_count > 3 and not all_albums:
-                        # Sort by Qobuz popularity (descending), then by year (ascending)
-                        display_albums = sorted(
-                            missing, key=lambda x: (-x.popularity, x.year)
-                        )[:3]
+                        # Top 3 by Qobuz popularity (descending), then year
+                        # (ascending) — nsmallest avoids sorting the rest
+                        display_albums = heapq.nsmallest(
+                            3, missing, key=lambda x: (-x.popularity, x.year)
+                        )
                         remaining_count = total_count - 3
 
-                    console.print(f"  [green]Found {total_count} new album(s):[/green]")
-
                     # When showing all, sort by year; when showing top 3, keep popularity order
                     if all_albums:
                         display_albums = sorted(display_albums, key=lambda x: x.year)
 
-                    for album in display_albums:
-                        fidelity = f"{album.bit_depth}bit/{album.sample_rate}kHz"
-                        if album.standard_id:
-                            # This is a hi-fi version that will have bonus tracks removed
-                            console.print(
-                                f"    [{album.year}] {album.title} "
-                                f"[magenta]({fidelity}, {album.standard_track_count} tracks)[/magenta] "
-                                f"[dim]id:{album.id}[/dim]"
-                            )
-                        else:
-                            console.print(
-                                f"    [{album.year}] {album.title} [dim]({fidelity})[/dim] "
-                                f"[dim]id:{album.id}[/dim]"
-                            )
+                    # One console.print per artist block, not per album
+                    lines = [f"  [green]Found {total_count} new album(s):[/green]"]
+                    lines += [_format_album_line(album) for album in display_albums]
 
                     if remaining_count > 0:
-                        console.print(
+                        lines.append(
                             f"    [dim]...and {remaining_count} more (use --all to see all)[/dim]"
                         )
+                    console.print("\n".join(lines))
             else:
                 console.print("  [dim]No new albums found.[/dim]")
         except Exception as e:
@@ -385,6 +535,8 @@ def download(
     album_id: Annotated[str, typer.Argument(help="Qobuz album ID")],
 ) -> None:
     """Download an album from Qobuz."""
+    from .qobuz import download_album
+
     url = f"https://open.qobuz.com/album/{album_id}"
     console.print(f"[cyan]Downloading: {album_id}[/cyan]")
 
@@ -410,31 +562,36 @@ def _print_preview(album_path: Path, preview: dict) -> bool:
     """
     has_changes = False
 
+    # Buffer the whole preview and emit one console.print per album:
+    # each print call pays Rich's full markup/render pipeline, and a
+    # bulk dry run renders hundreds of these blocks
+    lines = []
+
     # Metadata changes
     if preview["metadata_changes"]:
         has_changes = True
-        console.print("  [yellow]Metadata:[/yellow]")
+        lines.append("  [yellow]Metadata:[/yellow]")
         for item in preview["metadata_changes"]:
-            console.print(f"    {item['file']}:")
+            lines.append(f"    {item['file']}:")
             for change in item["changes"]:
-                console.print(f"      {change}")
+                lines.append(f"      {change}")
 
     # Genre
     if preview["genre"]["would_fetch"]:
         has_changes = True
-        console.print("  [yellow]Genre:[/yellow] would fetch from Last.fm")
+        lines.append("  [yellow]Genre:[/yellow] would fetch from Last.fm")
     elif preview["genre"]["current"]:
-        console.print(f"  [dim]Genre:[/dim] {preview['genre']['current']} (already set)")
+        lines.append(f"  [dim]Genre:[/dim] {preview['genre']['current']} (already set)")
 
     # Lyrics
     if preview["lyrics"]["missing"] > 0:
         has_changes = True
-        console.print(
+        lines.append(
             f"  [yellow]Lyrics:[/yellow] {preview['lyrics']['missing']} tracks missing, "
             f"{preview['lyrics']['have']} already have"
         )
     elif preview["lyrics"]["have"] > 0:
-        console.print(f"  [dim]Lyrics:[/dim] all {preview['lyrics']['have']} tracks have lyrics")
+        lines.append(f"  [dim]Lyrics:[/dim] all {preview['lyrics']['have']} tracks have lyrics")
 
     # Artwork
     if preview["artwork"]["found"]:
@@ -444,18 +601,21 @@ def _print_preview(album_path: Path, preview: dict) -> bool:
             if preview["artwork"]["needs_resize"]:
                 size_kb = preview["artwork"]["current_size"] / 1024
                 msg += f" (resize from {size_kb:.0f}KB)"
-            console.print(msg)
+            lines.append(msg)
         else:
-            console.print(f"  [dim]Artwork:[/dim] already embedded")
+            lines.append(f"  [dim]Artwork:[/dim] already embedded")
     else:
-        console.print("  [dim]Artwork:[/dim] no cover image found")
+        lines.append("  [dim]Artwork:[/dim] no cover image found")
 
     # ReplayGain
     if not preview["replaygain"]["has_tags"]:
         has_changes = True
-        console.print("  [yellow]ReplayGain:[/yellow] would apply normalization")
+        lines.append("  [yellow]ReplayGain:[/yellow] would apply normalization")
     else:
-        console.print("  [dim]ReplayGain:[/dim] already has tags")
+        lines.append("  [dim]ReplayGain:[/dim] already has tags")
+
+    if lines:
+        console.print("\n".join(lines))
 
     return has_changes
 
@@ -479,13 +639,11 @@ def process(
         music-librarian process "/path/to/Artist"
         music-librarian process --dry-run "/path/to/Alphabetical"
     """
-    if not path.exists():
-        console.print(f"[red]Path does not exist: {path}[/red]")
-        raise typer.Exit(1)
+    from .qobuz import preview_album_processing, process_album
 
-    if not path.is_dir():
-        console.print(f"[red]Path must be a directory: {path}[/red]")
-        raise typer.Exit(1)
+    _require_dir(
+        path, f"Path does not exist: {path}", f"Path must be a directory: {path}"
+    )
 
     albums = find_album_directories(path)
 
@@ -497,17 +655,24 @@ def process(
         console.print(f"[cyan]Previewing {len(albums)} album(s)...[/cyan]\n")
         albums_with_changes = 0
 
-        for album_path in albums:
-            console.print(f"[bold]{album_path.parent.name} / {album_path.name}[/bold]")
-            try:
-                preview = preview_album_processing(album_path)
-                if _print_preview(album_path, preview):
-                    albums_with_changes += 1
-                else:
-                    console.print("  [green]No changes needed[/green]")
-            except Exception as e:
-                console.print(f"  [red]Error: {e}[/red]")
-            console.print()
+        # Previews are independent, read-only tag/artwork probes, so run
+        # them on a thread pool and render in album order as they resolve
+        with ThreadPoolExecutor(max_workers=min(8, len(albums))) as executor:
+            futures = {
+                album_path: executor.submit(preview_album_processing, album_path)
+                for album_path in albums
+            }
+            for album_path in albums:
+                console.print(f"[bold]{album_path.parent.name} / {album_path.name}[/bold]")
+                try:
+                    preview = futures[album_path].result()
+                    if _print_preview(album_path, preview):
+                        albums_with_changes += 1
+                    else:
+                        console.print("  [green]No changes needed[/green]")
+                except Exception as e:
+                    console.print(f"  [red]Error: {e}[/red]")
+                console.print()
 
         console.print(f"[cyan]Summary: {albums_with_changes} of {len(albums)} album(s) have pending changes[/cyan]")
     else:
@@ -538,13 +703,11 @@ def normalize(
     path: Annotated[Path, typer.Argument(help="Path to album folder")],
 ) -> None:
     """Apply ReplayGain normalization to an album."""
-    if not path.exists():
-        console.print(f"[red]Path does not exist: {path}[/red]")
-        raise typer.Exit(1)
+    from .normalize import normalize_album
 
-    if not path.is_dir():
-        console.print(f"[red]Path must be a directory: {path}[/red]")
-        raise typer.Exit(1)
+    _require_dir(
+        path, f"Path does not exist: {path}", f"Path must be a directory: {path}"
+    )
 
     console.print(f"[cyan]Normalizing: {path}[/cyan]")
 
@@ -577,13 +740,11 @@ def convert(
     ] = None,
 ) -> None:
     """Convert FLAC album to AAC 256kbps."""
-    if not path.exists():
-        console.print(f"[red]Path does not exist: {path}[/red]")
-        raise typer.Exit(1)
+    from .convert import convert_album_to_aac
 
-    if not path.is_dir():
-        console.print(f"[red]Path must be a directory: {path}[/red]")
-        raise typer.Exit(1)
+    _require_dir(
+        path, f"Path does not exist: {path}", f"Path must be a directory: {path}"
+    )
 
     console.print(f"[cyan]Converting: {path}[/cyan]")
 
@@ -601,13 +762,11 @@ def embed_art(
     path: Annotated[Path, typer.Argument(help="Path to album folder")],
 ) -> None:
     """Embed cover artwork into FLAC files."""
-    if not path.exists():
-        console.print(f"[red]Path does not exist: {path}[/red]")
-        raise typer.Exit(1)
+    from .artwork import embed_artwork
 
-    if not path.is_dir():
-        console.print(f"[red]Path must be a directory: {path}[/red]")
-        raise typer.Exit(1)
+    _require_dir(
+        path, f"Path does not exist: {path}", f"Path must be a directory: {path}"
+    )
 
     console.print(f"[cyan]Embedding artwork: {path}[/cyan]")
 
@@ -641,6 +800,26 @@ def _open_in_cog(album_path: Path) -> None:
     console.print(f"[green]Opened in Cog:[/green] {album_path.name}")
 
 
+def _scan_new_folder_albums(directory: Path) -> list[Path]:
+    """List album folders in a directory, sorted case-insensitively.
+
+    Album folders are identified by the '{Artist} - [{YYYY}] {Album Title}'
+    naming pattern. scandir avoids a stat per entry; DirEntry caches the
+    file type from the directory read.
+    """
+    with os.scandir(directory) as entries:
+        albums = [
+            (e.name.lower(), e.path)
+            for e in entries
+            if e.is_dir(follow_symlinks=False) and parse_new_folder(e.name)
+        ]
+    # Sort on the raw names and build Path objects only for the result:
+    # DirEntry.name is a plain attribute, while Path.name re-parses the
+    # path string each access
+    albums.sort()
+    return [Path(path) for _, path in albums]
+
+
 def _list_albums_in(directory: Path, label: str, show_dest: bool = False) -> list[Path]:
     """List albums in a directory with index numbers.
 
@@ -652,10 +831,7 @@ def _list_albums_in(directory: Path, label: str, show_dest: bool = False) -> lis
     Returns:
         Sorted list of album directory paths.
     """
-    albums = sorted(
-        [d for d in directory.iterdir() if d.is_dir() and parse_new_folder(d.name)],
-        key=lambda d: d.name.lower(),
-    )
+    albums = _scan_new_folder_albums(directory)
     if not albums:
         console.print(f"[dim]No albums in {label}.[/dim]")
         return albums
@@ -684,8 +860,6 @@ def _parse_transfer_input(choice: str, max_idx: int) -> tuple[int, str] | None:
 
     Returns (index, action) tuple, or None if invalid. Index is 0 for quit.
     """
-    import re
-
     choice = choice.strip().lower()
 
     if not choice:
@@ -695,7 +869,7 @@ def _parse_transfer_input(choice: str, max_idx: int) -> tuple[int, str] | None:
         return (0, "q")
 
     # Parse index with optional action: "2", "2s", "2p", "2r", "2x"
-    match = re.match(r"(\d+)\s*([sprx])?", choice)
+    match = _TRANSFER_INPUT_RE.match(choice)
     if match:
         idx, action = match.groups()
         idx = int(idx)
@@ -709,16 +883,15 @@ def _parse_transfer_input(choice: str, max_idx: int) -> tuple[int, str] | None:
 
 def _interactive_stage(cons: Console) -> None:
     """Interactive album staging from Downloads to [New]."""
+    from .qobuz import process_album
+
     while True:
         # Refresh album list
         if not DOWNLOADS_PATH.exists():
             cons.print(f"[dim]Downloads folder not found: {DOWNLOADS_PATH}[/dim]")
             break
 
-        albums = sorted(
-            [d for d in DOWNLOADS_PATH.iterdir() if d.is_dir() and parse_new_folder(d.name)],
-            key=lambda d: d.name.lower(),
-        )
+        albums = _scan_new_folder_albums(DOWNLOADS_PATH)
 
         if not albums:
             cons.print("[dim]No albums in Downloads.[/dim]")
@@ -800,16 +973,15 @@ def _interactive_stage(cons: Console) -> None:
 
 def _interactive_shelve(cons: Console) -> None:
     """Interactive album shelving from [New] to library."""
+    from .qobuz import process_album
+
     while True:
         # Refresh album list
         if not NEW_PATH.exists():
             cons.print(f"[red][New] folder not found: {NEW_PATH}[/red]")
             break
 
-        albums = sorted(
-            [d for d in NEW_PATH.iterdir() if d.is_dir() and parse_new_folder(d.name)],
-            key=lambda d: d.name.lower(),
-        )
+        albums = _scan_new_folder_albums(NEW_PATH)
 
         if not albums:
             cons.print("[dim]No albums in [New].[/dim]")
@@ -951,10 +1123,7 @@ def stage(
             console.print(f"[dim]Downloads folder not found: {DOWNLOADS_PATH}[/dim]")
             raise typer.Exit(1)
 
-        albums = sorted(
-            [d for d in DOWNLOADS_PATH.iterdir() if d.is_dir() and parse_new_folder(d.name)],
-            key=lambda d: d.name.lower(),
-        )
+        albums = _scan_new_folder_albums(DOWNLOADS_PATH)
         if not albums:
             console.print("[dim]No albums in Downloads.[/dim]")
             raise typer.Exit(1)
@@ -965,13 +1134,7 @@ def stage(
     else:
         path = DOWNLOADS_PATH / name
 
-    if not path.exists():
-        console.print(f"[red]Folder not found: {path}[/red]")
-        raise typer.Exit(1)
-
-    if not path.is_dir():
-        console.print(f"[red]Not a directory: {path}[/red]")
-        raise typer.Exit(1)
+    _require_dir(path, f"Folder not found: {path}", f"Not a directory: {path}")
 
     parsed = parse_new_folder(path.name)
     if not parsed:
@@ -1092,10 +1255,7 @@ def shelve(
         return
 
     if index is not None:
-        albums = sorted(
-            [d for d in NEW_PATH.iterdir() if d.is_dir() and parse_new_folder(d.name)],
-            key=lambda d: d.name.lower(),
-        )
+        albums = _scan_new_folder_albums(NEW_PATH)
         if not albums:
             console.print("[dim]No albums in [New].[/dim]")
             raise typer.Exit(1)
@@ -1106,13 +1266,7 @@ def shelve(
     else:
         path = NEW_PATH / name
 
-    if not path.exists():
-        console.print(f"[red]Folder not found: {path}[/red]")
-        raise typer.Exit(1)
-
-    if not path.is_dir():
-        console.print(f"[red]Not a directory: {path}[/red]")
-        raise typer.Exit(1)
+    _require_dir(path, f"Folder not found: {path}", f"Not a directory: {path}")
 
     parsed = parse_new_folder(path.name)
     if not parsed:
@@ -1210,7 +1364,15 @@ def ignore_list() -> None:
 
     if albums:
         console.print("\n[bold]Ignored Albums:[/bold]")
-        for entry in sorted(albums, key=lambda x: (x["artist"].lower(), x["album"].lower())):
+        # Decorate-sort-undecorate: tuple comparison runs at C level
+        # instead of calling a key lambda per element (the index breaks
+        # full ties before the unorderable dict is reached)
+        decorated = [
+            (entry["artist"].casefold(), entry["album"].casefold(), i, entry)
+            for i, entry in enumerate(albums)
+        ]
+        decorated.sort()
+        for _, _, _, entry in decorated:
             console.print(f"  {entry['artist']} - {entry['album']}")
 
 
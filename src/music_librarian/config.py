@@ -1,13 +1,9 @@
 """Configuration settings for music-librarian."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
-
-# Load .env file from project root if it exists
-load_dotenv()
-
 # Library paths
 MUSIC_VOLUME = Path("/Volumes/music")
 LIBRARY_PATH = Path("/Volumes/music/Alphabetical")
@@ -18,8 +14,26 @@ AAC_OUTPUT_PATH = DOWNLOADS_PATH / "transcoded"
 # qobuz-dl config location
 QOBUZ_CONFIG_PATH = Path.home() / ".config" / "qobuz-dl" / "config.ini"
 
-# Last.fm API key (get one free at https://www.last.fm/api/account/create)
-LASTFM_API_KEY = os.environ.get("LASTFM_API_KEY", "")
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load the .env file from the project root if it exists.
+
+    Deferred to first API-key access: load_dotenv walks the filesystem
+    looking for a .env file, which every CLI invocation — including
+    --help — would otherwise pay at import time.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
 
-# Genius API key (get one at https://genius.com/api-clients)
-GENIUS_API_KEY = os.environ.get("GENIUS_API_KEY", "")
+# API keys, resolved lazily via PEP 562 so `from .config import
+# LASTFM_API_KEY` still works but the dotenv read happens on first
+# access rather than at import:
+# - LASTFM_API_KEY (get one free at https://www.last.fm/api/account/create)
+# - GENIUS_API_KEY (get one at https://genius.com/api-clients)
+def __getattr__(name: str) -> str:
+    if name in ("LASTFM_API_KEY", "GENIUS_API_KEY"):
+        _load_env()
+        return os.environ.get(name, "")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 """Format conversion to AAC using ffmpeg."""
 
+import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -41,38 +42,102 @@ def convert_album_to_aac(
     output_path = output_base / artist_name / album_name
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Find all FLAC files
-    flac_files = list(album_path.glob("*.flac"))
+    # Find all FLAC files. scandir's DirEntry carries the file type from
+    # the directory read, so this pays no stat per entry — glob would, and
+    # on a network mount each stat is a round-trip. The same pass records
+    # every filename for the cover-art lookup below.
+    flac_files: list[Path] = []
+    files_lower: dict[str, str] = {}
+    with os.scandir(album_path) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            files_lower[entry.name.lower()] = entry.path
+            if entry.name.lower().endswith(".flac"):
+                flac_files.append(Path(entry.path))
+    flac_files.sort()
     if not flac_files:
         raise ValueError(f"No FLAC files found in {album_path}")
 
-    # Convert each FLAC file
-    for flac_file in flac_files:
-        output_file = output_path / (flac_file.stem + ".m4a")
-
-        subprocess.run(
-            [
-                "ffmpeg",
+    # Convert concurrently, one ffmpeg process per batch rather than per
+    # track: each process encodes its batch through multiple -i/-map
+    # pairs, paying fork+exec and AudioToolbox initialization once per
+    # batch instead of once per file; -threads 1 keeps each encoder
+    # single-threaded so parallelism stays across batches. The children
+    # run concurrently on their own, so they are started with Popen and
+    # reaped directly — no thread pool blocking in subprocess.run.
+    def _start_batch(batch: list[Path]) -> subprocess.Popen:
+        # -nostdin/-hide_banner/-loglevel trim startup work, and pinning
+        # the input format with a minimal probe skips container
+        # autodetection — ffmpeg otherwise reads and analyzes each file
+        # head before decoding
+        args = [
+            "ffmpeg",
+            "-hide_banner",
+            "-nostdin",
+            "-loglevel",
+            "error",
+            "-y",  # Overwrite outputs
+        ]
+        for flac_file in batch:
+            args += [
+                "-probesize",
+                "32",
+                "-analyzeduration",
+                "0",
+                "-f",
+                "flac",
                 "-i",
                 str(flac_file),
+            ]
+        for i, flac_file in enumerate(batch):
+            args += [
+                "-map",
+                f"{i}:a",
+                "-threads",
+                "1",
                 "-c:a",
                 "aac_at",
                 "-q:a",
                 "2",
-                "-movflags",
-                "+faststart",
-                "-y",  # Overwrite output
-                str(output_file),
-            ],
-            capture_output=True,
-            check=True,
+                # No -movflags +faststart: it re-passes the file to move
+                # the moov atom up front, doubling write I/O, and only
+                # matters for progressive HTTP streaming — these files
+                # are played locally
+                str(output_path / (flac_file.stem + ".m4a")),
+            ]
+
+        return subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
 
-    # Copy cover art if present
+    workers = min(len(flac_files), os.cpu_count() or 4)
+    batches = [flac_files[i::workers] for i in range(workers)]
+    procs = [_start_batch(batch) for batch in batches]
+
+    # Reap every child before raising so a failure doesn't leave the
+    # others encoding unsupervised; surface the first failure afterwards
+    failure: subprocess.CalledProcessError | None = None
+    for proc in procs:
+        _, stderr = proc.communicate()
+        if proc.returncode != 0 and failure is None:
+            failure = subprocess.CalledProcessError(
+                proc.returncode, proc.args, stderr=stderr
+            )
+    if failure is not None:
+        raise failure
+
+    # Copy cover art if present. The directory listing above already has
+    # every filename, so each candidate is a dict lookup instead of a
+    # stat round-trip (and the match is case-insensitive for free).
+    # copyfile, not copy2: only the bytes matter, so skip the utime/
+    # chmod/xattr syscalls copy2 spends preserving source metadata.
     for cover_name in ["cover.jpg", "cover.png", "folder.jpg", "folder.png"]:
-        cover_file = album_path / cover_name
-        if cover_file.exists():
-            shutil.copy2(cover_file, output_path / cover_name)
+        cover_file = files_lower.get(cover_name)
+        if cover_file is not None:
+            shutil.copyfile(Path(cover_file), output_path / cover_name)
             break
 
     return output_path
@@ -1,32 +1,96 @@
 """Ignore list management for albums and artists."""
 
 import json
+import os
+from contextlib import contextmanager
 from pathlib import Path
 
 # Default location for ignore list
 IGNORE_FILE = Path.home() / ".config" / "music-librarian" / "ignore.json"
 
+# Parsed ignore files keyed by path, validated against the file's mtime:
+# every query helper goes through _load_indexed, which would otherwise
+# re-open and re-parse the JSON on each of thousands of checks during a
+# scan. The canonical in-memory shape is a pair of dicts keyed by
+# lowercase name (see _index), so lookups, adds, and removals are all
+# O(1) — the JSON list shape is materialized only when saving. External
+# edits still show up because a changed mtime reloads.
+_cache: dict[Path, tuple[int, dict, dict, frozenset]] = {}
 
-def _load_ignore_list(path: Path | None = None) -> dict:
-    """Load the ignore list from disk."""
+
+def _index(data: dict) -> tuple[dict[str, str], dict[tuple[str, str], dict]]:
+    """Build the dict-keyed canonical form from raw JSON ignore data.
+
+    Returns (lowercase artist -> original name, lowercase (artist, album)
+    -> entry dict). Insertion order is preserved, so the file round-trips
+    in the order entries were added.
+    """
+    artists = {a.lower(): a for a in data["artists"]}
+    albums = {
+        (e["artist"].lower(), e["album"].lower()): e for e in data["albums"]
+    }
+    return artists, albums
+
+
+def _load_indexed(
+    path: Path | None = None,
+) -> tuple[dict[str, str], dict[tuple[str, str], dict], frozenset]:
+    """Load the indexed ignore list (cached until the file changes).
+
+    Returns (artists map, albums map, artists with any album entry); the
+    last set lets the variant check bail out for the common artist with
+    no ignored albums at all.
+    """
     if path is None:
         path = IGNORE_FILE
 
-    if not path.exists():
-        return {"artists": [], "albums": []}
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return {}, {}, frozenset()
+
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2], cached[3]
 
     with open(path) as f:
-        return json.load(f)
+        data = json.load(f)
+    artists, albums = _index(data)
+    album_artists = frozenset(a for a, _ in albums)
+    _cache[path] = (mtime, artists, albums, album_artists)
+    return artists, albums, album_artists
+
+
+def _materialize(
+    artists: dict[str, str], albums: dict[tuple[str, str], dict]
+) -> dict:
+    """Convert the dict-keyed form back to the JSON file shape."""
+    return {"artists": list(artists.values()), "albums": list(albums.values())}
+
+
+def _load_ignore_list(path: Path | None = None) -> dict:
+    """Load the ignore list from disk in its JSON shape."""
+    artists, albums, _ = _load_indexed(path)
+    return _materialize(artists, albums)
 
 
 def _save_ignore_list(data: dict, path: Path | None = None) -> None:
-    """Save the ignore list to disk."""
+    """Save the ignore list to disk atomically.
+
+    The JSON is serialized in one shot and written to a temp file that
+    os.replace swaps into place, so a crash mid-write can never leave a
+    truncated ignore.json behind.
+    """
     if path is None:
         path = IGNORE_FILE
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, path)
+    artists, albums = _index(data)
+    album_artists = frozenset(a for a, _ in albums)
+    _cache[path] = (path.stat().st_mtime_ns, artists, albums, album_artists)
 
 
 def add_ignored_artist(artist: str) -> bool:
@@ -34,14 +98,14 @@ def add_ignored_artist(artist: str) -> bool:
 
     Returns True if added, False if already present.
     """
-    data = _load_ignore_list()
-    artist_lower = artist.lower()
+    artists, albums, _ = _load_indexed()
 
-    if artist_lower not in [a.lower() for a in data["artists"]]:
-        data["artists"].append(artist)
-        _save_ignore_list(data)
-        return True
-    return False
+    if artist.lower() in artists:
+        return False
+
+    artists = {**artists, artist.lower(): artist}
+    _save_ignore_list(_materialize(artists, albums))
+    return True
 
 
 def remove_ignored_artist(artist: str) -> bool:
@@ -49,15 +113,15 @@ def remove_ignored_artist(artist: str) -> bool:
 
     Returns True if removed, False if not found.
     """
-    data = _load_ignore_list()
-    artist_lower = artist.lower()
+    artists, albums, _ = _load_indexed()
 
-    for i, a in enumerate(data["artists"]):
-        if a.lower() == artist_lower:
-            data["artists"].pop(i)
-            _save_ignore_list(data)
-            return True
-    return False
+    if artist.lower() not in artists:
+        return False
+
+    artists = dict(artists)
+    del artists[artist.lower()]
+    _save_ignore_list(_materialize(artists, albums))
+    return True
 
 
 def add_ignored_album(artist: str, album: str) -> bool:
@@ -65,16 +129,14 @@ def add_ignored_album(artist: str, album: str) -> bool:
 
     Returns True if added, False if already present.
     """
-    data = _load_ignore_list()
-    artist_lower = artist.lower()
-    album_lower = album.lower()
+    artists, albums, _ = _load_indexed()
 
-    for entry in data["albums"]:
-        if entry["artist"].lower() == artist_lower and entry["album"].lower() == album_lower:
-            return False
+    key = (artist.lower(), album.lower())
+    if key in albums:
+        return False
 
-    data["albums"].append({"artist": artist, "album": album})
-    _save_ignore_list(data)
+    albums = {**albums, key: {"artist": artist, "album": album}}
+    _save_ignore_list(_materialize(artists, albums))
     return True
 
 
@@ -83,47 +145,104 @@ def remove_ignored_album(artist: str, album: str) -> bool:
 
     Returns True if removed, False if not found.
     """
-    data = _load_ignore_list()
-    artist_lower = artist.lower()
-    album_lower = album.lower()
+    artists, albums, _ = _load_indexed()
 
-    for i, entry in enumerate(data["albums"]):
-        if entry["artist"].lower() == artist_lower and entry["album"].lower() == album_lower:
-            data["albums"].pop(i)
-            _save_ignore_list(data)
-            return True
-    return False
+    key = (artist.lower(), album.lower())
+    if key not in albums:
+        return False
+
+    albums = dict(albums)
+    del albums[key]
+    _save_ignore_list(_materialize(artists, albums))
+    return True
 
 
 def get_ignored_artists() -> list[str]:
     """Get list of ignored artists."""
-    data = _load_ignore_list()
-    return data["artists"]
+    artists, _, _ = _load_indexed()
+    return list(artists.values())
 
 
 def get_ignored_albums() -> list[dict]:
     """Get list of ignored albums."""
-    data = _load_ignore_list()
-    return data["albums"]
+    _, albums, _ = _load_indexed()
+    return list(albums.values())
 
 
 def is_artist_ignored(artist: str) -> bool:
     """Check if an artist is ignored."""
-    data = _load_ignore_list()
-    artist_lower = artist.lower()
-    return any(a.lower() == artist_lower for a in data["artists"])
+    artists, _, _ = _load_indexed()
+    return artist.lower() in artists
 
 
 def is_album_ignored(artist: str, album: str) -> bool:
     """Check if an album is ignored."""
-    data = _load_ignore_list()
-    artist_lower = artist.lower()
-    album_lower = album.lower()
+    _, albums, _ = _load_indexed()
+    return (artist.lower(), album.lower()) in albums
 
-    return any(
-        entry["artist"].lower() == artist_lower and entry["album"].lower() == album_lower
-        for entry in data["albums"]
-    )
+
+class _IgnoreTransaction:
+    """In-memory mutator handed out by ignore_transaction."""
+
+    def __init__(
+        self, artists: dict[str, str], albums: dict[tuple[str, str], dict]
+    ):
+        self._artists = artists
+        self._albums = albums
+        self.changed = False
+
+    def add_artist(self, artist: str) -> bool:
+        """Add an artist. Returns True if added, False if already present."""
+        if artist.lower() in self._artists:
+            return False
+        self._artists[artist.lower()] = artist
+        self.changed = True
+        return True
+
+    def remove_artist(self, artist: str) -> bool:
+        """Remove an artist. Returns True if removed, False if not found."""
+        if self._artists.pop(artist.lower(), None) is None:
+            return False
+        self.changed = True
+        return True
+
+    def add_album(self, artist: str, album: str) -> bool:
+        """Add an album. Returns True if added, False if already present."""
+        key = (artist.lower(), album.lower())
+        if key in self._albums:
+            return False
+        self._albums[key] = {"artist": artist, "album": album}
+        self.changed = True
+        return True
+
+    def remove_album(self, artist: str, album: str) -> bool:
+        """Remove an album. Returns True if removed, False if not found."""
+        key = (artist.lower(), album.lower())
+        if self._albums.pop(key, None) is None:
+            return False
+        self.changed = True
+        return True
+
+
+@contextmanager
+def ignore_transaction(path: Path | None = None):
+    """Batch several ignore-list edits into one load and one save.
+
+    The single-shot helpers (add_ignored_album etc.) each rewrite the
+    whole file; a bulk import of N entries pays N serializations. Within
+    a transaction, mutations run against in-memory copies and the file
+    is written once on exit — and only if something actually changed.
+
+        with ignore_transaction() as txn:
+            for artist, album in entries:
+                txn.add_album(artist, album)
+    """
+    artists, albums, _ = _load_indexed(path)
+    # Copies, so an aborted transaction can't leave mutations in the cache
+    txn = _IgnoreTransaction(dict(artists), dict(albums))
+    yield txn
+    if txn.changed:
+        _save_ignore_list(_materialize(txn._artists, txn._albums), path)
 
 
 def is_album_ignored_with_variants(
@@ -147,17 +266,24 @@ def is_album_ignored_with_variants(
     Returns:
         True if any combination is in the ignore list.
     """
-    data = _load_ignore_list()
+    _, albums, album_artists = _load_indexed()
+    if not albums:
+        return False
+
+    canonical_lower = canonical_name.lower()
+    artist_variants = {artist_name.lower(), canonical_lower, f"the {canonical_lower}"}
+
+    # Most artists have no ignored albums at all; one set intersection
+    # prunes those before any (variant, title) pair is probed
+    if not (artist_variants & album_artists):
+        return False
 
-    artist_variants = {artist_name.lower(), canonical_name.lower(), f"the {canonical_name}".lower()}
     title_variants = {album_title.lower()}
     if normalized_title:
         title_variants.add(normalized_title.lower())
 
-    for entry in data["albums"]:
-        entry_artist = entry["artist"].lower()
-        entry_album = entry["album"].lower()
-        if entry_artist in artist_variants and entry_album in title_variants:
-            return True
-
-    return False
+    # At most 3 × 2 pairs against the lookup dict, instead of scanning
+    # every ignored album per call
+    return any(
+        (a, t) in albums for a in artist_variants for t in title_variants
+    )
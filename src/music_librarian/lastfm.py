@@ -1,18 +1,116 @@
 """Last.fm API integration for album popularity data."""
 
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import httpx
 
+# Optional speed extra: orjson parses response bytes in C, which shows
+# up on the larger Last.fm payloads
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from .config import LASTFM_API_KEY
 
 LASTFM_API_URL = "https://ws.audioscrobbler.com/2.0/"
 
+# Bound how long one stalled lookup can hold up a batch: connects and
+# reads fail fast instead of waiting out a single flat 10s budget
+LASTFM_TIMEOUT = httpx.Timeout(10, connect=2, read=4)
+
+# On-disk cache for lookup results (see _cache_get). Listener counts and
+# top tags drift slowly, so entries stay valid for a week.
+LASTFM_CACHE_FILE = Path.home() / ".cache" / "music-librarian" / "lastfm.json"
+LASTFM_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Within-run memo over the cache file: repeat lookups in one process
+# skip even the file read and JSON parse. Entries mirror the file's
+# (value, timestamp) pairs; the TTL is checked on every read.
+_memory_cache: dict[str, tuple] = {}
+
+# Failed lookups keyed by (method, artist) -> monotonic expiry. When
+# Last.fm is rate-limiting or an artist is unknown, every album lookup
+# for that artist would otherwise burn its full timeout; one failure
+# short-circuits the rest of the run until the entry expires.
+_negative_cache: dict[tuple[str, str], float] = {}
+_NEGATIVE_TTL = 300
+
+# Serializes _cache_set's read-modify-write of the cache file:
+# rank_albums_by_popularity fans lookups across threads, and two
+# interleaved writers would drop each other's entries
+_cache_write_lock = threading.Lock()
+
+
+def _cache_get(key: str):
+    """Return the cached value for key, or None if absent or expired.
+
+    Each Last.fm lookup is a full HTTPS round trip, and bulk runs repeat
+    the same artists and albums across invocations — so successful
+    results are kept in a small JSON file and reused within the TTL,
+    with an in-memory layer for repeats within one run.
+    """
+    entry = _memory_cache.get(key)
+    if entry is None:
+        try:
+            entries = json.loads(LASTFM_CACHE_FILE.read_text())
+            entry = tuple(entries[key])
+        except Exception:
+            return None
+    value, stored_at = entry
+    if time.time() - stored_at > LASTFM_CACHE_TTL:
+        return None
+    _memory_cache[key] = (value, stored_at)
+    return value
+
+
+def _cache_set(key: str, value) -> None:
+    """Store a lookup result in the cache file (best-effort).
 
-def _call_lastfm_api(method: str, api_key: str | None = None, **params) -> dict | None:
+    The read-modify-write runs under a lock so concurrent lookups don't
+    lose each other's entries, and the file is swapped in via os.replace
+    so a writer can never leave truncated JSON behind (the same pattern
+    _save_ignore_list uses).
+    """
+    stored_at = time.time()
+    _memory_cache[key] = (value, stored_at)
+    with _cache_write_lock:
+        try:
+            entries = json.loads(LASTFM_CACHE_FILE.read_text())
+        except Exception:
+            entries = {}
+        entries[key] = [value, stored_at]
+        try:
+            LASTFM_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = LASTFM_CACHE_FILE.with_suffix(
+                LASTFM_CACHE_FILE.suffix + ".tmp"
+            )
+            tmp.write_text(json.dumps(entries))
+            os.replace(tmp, LASTFM_CACHE_FILE)
+        except OSError:
+            pass  # Cache is best-effort; the lookup result still stands
+
+
+def _call_lastfm_api(
+    method: str,
+    api_key: str | None = None,
+    client: httpx.Client | None = None,
+    **params,
+) -> dict | None:
     """Make a Last.fm API call.
 
     Args:
         method: API method name (e.g., "album.getinfo").
         api_key: Last.fm API key. If None, uses LASTFM_API_KEY from config/env.
+        client: Shared httpx client. Callers making several requests
+            should pass one so the pooled keep-alive connection is
+            reused; a throwaway client (TCP + TLS handshake per call)
+            is created only when none is given.
         **params: Additional parameters to pass to the API.
 
     Returns:
@@ -24,35 +122,73 @@ def _call_lastfm_api(method: str, api_key: str | None = None, **params) -> dict
     if not api_key:
         return None
 
+    neg_key = (method, str(params.get("artist", "")).lower())
+    expiry = _negative_cache.get(neg_key)
+    if expiry is not None:
+        if time.monotonic() < expiry:
+            return None
+        del _negative_cache[neg_key]
+
     try:
-        with httpx.Client(timeout=10) as client:
+        own_client = None
+        if client is None:
+            own_client = client = httpx.Client(timeout=LASTFM_TIMEOUT)
+        try:
             response = client.get(
                 LASTFM_API_URL,
                 params={"method": method, "api_key": api_key, "format": "json", **params},
             )
-            if response.status_code != 200:
-                return None
-            return response.json()
+        finally:
+            if own_client is not None:
+                own_client.close()
+        if response.status_code == 429:
+            # Rate-limited: honor Retry-After when the server sends one
+            try:
+                backoff = float(response.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                backoff = _NEGATIVE_TTL
+            _negative_cache[neg_key] = time.monotonic() + backoff
+            return None
+        if response.status_code != 200:
+            return None
+        return _json_loads(response.content)
+    except httpx.TimeoutException:
+        _negative_cache[neg_key] = time.monotonic() + _NEGATIVE_TTL
+        return None
     except Exception:
         return None
 
 
-def get_album_listeners(artist: str, album: str, api_key: str | None = None) -> int:
+def get_album_listeners(
+    artist: str,
+    album: str,
+    api_key: str | None = None,
+    client: httpx.Client | None = None,
+) -> int:
     """Get listener count for an album from Last.fm.
 
     Args:
         artist: Artist name.
         album: Album title.
         api_key: Last.fm API key. If None, uses LASTFM_API_KEY from config/env.
+        client: Shared httpx client (see _call_lastfm_api).
 
     Returns:
         Number of listeners, or 0 if not found.
     """
-    data = _call_lastfm_api("album.getinfo", api_key, artist=artist, album=album)
+    cache_key = f"listeners:{artist.lower()}|{album.lower()}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    data = _call_lastfm_api(
+        "album.getinfo", api_key, client=client, artist=artist, album=album
+    )
     if not data:
-        return 0
-    listeners = data.get("album", {}).get("listeners", "0")
-    return int(listeners)
+        return 0  # Failures aren't cached; retry next run
+    listeners = int(data.get("album", {}).get("listeners", "0"))
+    _cache_set(cache_key, listeners)
+    return listeners
 
 
 def get_artist_top_tag(artist: str, api_key: str | None = None) -> str | None:
@@ -65,12 +201,20 @@ def get_artist_top_tag(artist: str, api_key: str | None = None) -> str | None:
     Returns:
         Top tag name, or None if not found.
     """
+    cache_key = f"toptag:{artist.lower()}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     data = _call_lastfm_api("artist.getTopTags", api_key, artist=artist)
     if not data:
         return None
     tags = data.get("toptags", {}).get("tag", [])
     if tags:
-        return tags[0].get("name")
+        tag = tags[0].get("name")
+        if tag is not None:
+            _cache_set(cache_key, tag)
+        return tag
     return None
 
 
@@ -89,6 +233,23 @@ def rank_albums_by_popularity(
     Returns:
         List of (album, listeners) tuples sorted by listeners descending.
     """
-    ranked = [(album, get_album_listeners(artist, album.title, api_key)) for album in albums]
+    if not albums:
+        return []
+
+    # One pooled client for the whole batch (keep-alive instead of a TCP
+    # + TLS handshake per album), with the lookups fanned out across a
+    # small thread pool so the round-trips overlap
+    with httpx.Client(timeout=LASTFM_TIMEOUT) as client:
+        with ThreadPoolExecutor(max_workers=min(8, len(albums))) as executor:
+            listeners = list(
+                executor.map(
+                    lambda a: get_album_listeners(
+                        artist, a.title, api_key, client=client
+                    ),
+                    albums,
+                )
+            )
+
+    ranked = list(zip(albums, listeners))
     ranked.sort(key=lambda x: x[1], reverse=True)
     return ranked
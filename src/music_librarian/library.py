@@ -1,13 +1,29 @@
 """Library scanning and parsing functionality."""
 
+import hashlib
+import os
+import pickle
 import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from rapidfuzz import fuzz, process
-
 from .config import LIBRARY_PATH
 
+# rapidfuzz is imported inside the fuzzy-matching functions: it is the
+# one heavy import in this module, and most commands (scan, stage,
+# shelve) never fuzzy-match, so CLI startup shouldn't pay for it.
+
+# Cached scan results, keyed by library path (see scan_library_cached)
+SCAN_CACHE_DIR = Path.home() / ".cache" / "music-librarian"
+
+# Folder-name patterns, compiled once: these parsers run per directory
+# entry during library walks and album listings
+_ALBUM_FOLDER_RE = re.compile(r"\[(\d{4})\]\s*(.+)")
+_NEW_FOLDER_RE = re.compile(r"(.+?)\s*-\s*\[(\d{4})\]\s*(.+)")
+
 
 @dataclass
 class Album:
@@ -16,6 +32,11 @@ class Album:
     year: int
     title: str
     path: Path
+    lower_title: str = ""  # Lowercased once here; reused by ignore checks
+
+    def __post_init__(self):
+        if not self.lower_title:
+            self.lower_title = self.title.lower()
 
 
 @dataclass
@@ -26,11 +47,22 @@ class Artist:
     canonical_name: str  # Name as stored in library (may have "The" prefix)
     albums: list[Album]
     path: Path
+    lower_name: str = ""  # Lowercased once here; reused by ignore checks
+
+    def __post_init__(self):
+        if not self.lower_name:
+            self.lower_name = self.name.lower()
 
 
+@lru_cache(maxsize=4096)
 def normalize_artist(name: str) -> str:
-    """Normalize artist name by stripping leading 'The ' prefix."""
-    if name.lower().startswith("the "):
+    """Normalize artist name by stripping leading 'The ' prefix.
+
+    Cached: discover normalizes the same names repeatedly through the
+    ignore filter and matching paths.
+    """
+    # Lowercase only the 4-char prefix rather than copying the whole name
+    if name[:4].lower() == "the ":
         return name[4:]
     return name
 
@@ -53,7 +85,7 @@ def parse_album_folder(folder_name: str) -> tuple[int, str] | None:
 
     Returns (year, title) tuple or None if parsing fails.
     """
-    match = re.match(r"\[(\d{4})\]\s*(.+)", folder_name)
+    match = _ALBUM_FOLDER_RE.fullmatch(folder_name)
     if match:
         return int(match.group(1)), match.group(2)
     return None
@@ -70,54 +102,187 @@ def get_letter_for_artist(artist_name: str) -> str:
     return "A"  # Fallback
 
 
+def _scan_artist_dir(artist_dir: str) -> Artist | None:
+    """List one artist's album folders (runs on a scan worker thread).
+
+    Takes the directory as a plain string: the walk keeps str paths
+    throughout and only builds Path objects for the Artist/Album records
+    it actually keeps.
+    """
+    albums: list[Album] = []
+
+    with os.scandir(artist_dir) as entries:
+        subdirs = sorted(
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+        )
+
+    for name, album_path in subdirs:
+        parsed = parse_album_folder(name)
+        if parsed:
+            year, title = parsed
+            albums.append(Album(year=year, title=title, path=Path(album_path)))
+
+    if not albums:
+        return None
+    canonical_name = os.path.basename(artist_dir)
+    return Artist(
+        name=normalize_artist(canonical_name),
+        canonical_name=canonical_name,
+        albums=albums,
+        path=Path(artist_dir),
+    )
+
+
+def iter_library_artists(library_path: Path | None = None) -> Iterator[Artist]:
+    """Yield artists in the library one at a time, in folder order.
+
+    The letter and artist levels are listed up front with os.scandir
+    (DirEntry's cached type means no stat per entry), then the per-artist
+    album listings — one independent directory read each — are fanned
+    out to a thread pool so their round-trips overlap on a network
+    mount. Results stream back in folder order; scan_library
+    materializes them into its sorted dict, while callers that just
+    stream can iterate directly.
+
+    Args:
+        library_path: Path to library root. Defaults to LIBRARY_PATH.
+    """
+    if library_path is None:
+        library_path = LIBRARY_PATH
+
+    if not library_path.exists():
+        return
+
+    # Letter folders (A, B, C, etc.), then artist folders within each.
+    # Paths stay plain strings here — they sort at C level and skip a
+    # Path allocation per directory that would mostly be thrown away.
+    artist_dirs: list[str] = []
+    with os.scandir(library_path) as letters:
+        letter_dirs = sorted(
+            entry.path
+            for entry in letters
+            if entry.is_dir(follow_symlinks=False) and len(entry.name) == 1
+        )
+    for letter_path in letter_dirs:
+        with os.scandir(letter_path) as entries:
+            artist_dirs.extend(
+                sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                )
+            )
+
+    if not artist_dirs:
+        return
+
+    workers = min(16, len(artist_dirs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for artist in executor.map(_scan_artist_dir, artist_dirs):
+            if artist is not None:
+                yield artist
+
+
 def scan_library(library_path: Path | None = None) -> dict[str, Artist]:
     """Scan the music library and return a dict of artists.
 
     Args:
         library_path: Path to library root. Defaults to LIBRARY_PATH.
 
+    Returns:
+        Dict mapping normalized artist name to Artist object.
+    """
+    # Return in case-insensitive name order so callers can iterate
+    # directly instead of each re-sorting the values. Decorate-sort-
+    # undecorate: the tuples compare at C level, with no Python key
+    # callback per element (the index breaks casefold ties before the
+    # unorderable Artist is reached).
+    decorated = [
+        (artist.name.casefold(), i, artist)
+        for i, artist in enumerate(iter_library_artists(library_path))
+    ]
+    decorated.sort()
+    return {artist.name: artist for _, _, artist in decorated}
+
+
+def _library_signature(library_path: Path) -> list[tuple[str, float]] | None:
+    """Fingerprint the library's directory structure for cache validation.
+
+    scan_library only reads folder names, and creating, removing, or
+    renaming an album folder updates its parent's mtime — so the mtimes
+    of the root, letter, and artist directories fully determine the scan
+    result. Collecting them touches a few hundred directories instead of
+    walking every album folder.
+
+    Returns None if the library path doesn't exist.
+    """
+    if not library_path.exists():
+        return None
+
+    signature = [(str(library_path), library_path.stat().st_mtime)]
+    with os.scandir(library_path) as letters:
+        letter_dirs = [
+            e
+            for e in letters
+            if e.is_dir(follow_symlinks=False) and len(e.name) == 1
+        ]
+    for letter in letter_dirs:
+        signature.append((letter.path, letter.stat().st_mtime))
+        with os.scandir(letter.path) as artists:
+            for artist in artists:
+                if artist.is_dir(follow_symlinks=False):
+                    signature.append((artist.path, artist.stat().st_mtime))
+
+    signature.sort()
+    return signature
+
+
+def scan_library_cached(
+    library_path: Path | None = None, refresh: bool = False
+) -> dict[str, Artist]:
+    """Scan the library, reusing a cached result when nothing has changed.
+
+    Back-to-back scan/discover invocations rarely see a changed library,
+    but each one pays a full walk — expensive over a network mount. The
+    scan result is pickled under SCAN_CACHE_DIR together with a directory
+    mtime signature (see _library_signature); a cached result is reused
+    only while the signature still matches.
+
+    Args:
+        library_path: Path to library root. Defaults to LIBRARY_PATH.
+        refresh: Force a fresh scan, bypassing the cache.
+
     Returns:
         Dict mapping normalized artist name to Artist object.
     """
     if library_path is None:
         library_path = LIBRARY_PATH
 
-    artists: dict[str, Artist] = {}
+    key = hashlib.sha1(str(library_path.resolve()).encode()).hexdigest()[:16]
+    cache_file = SCAN_CACHE_DIR / f"scan-{key}.pkl"
 
-    if not library_path.exists():
-        return artists
-
-    # Iterate through letter folders (A, B, C, etc.)
-    for letter_folder in sorted(library_path.iterdir()):
-        if not letter_folder.is_dir() or len(letter_folder.name) != 1:
-            continue
-
-        # Iterate through artist folders
-        for artist_folder in sorted(letter_folder.iterdir()):
-            if not artist_folder.is_dir():
-                continue
-
-            artist_name = artist_folder.name
-            normalized_name = normalize_artist(artist_name)
-            albums: list[Album] = []
-
-            # Iterate through album folders
-            for album_folder in sorted(artist_folder.iterdir()):
-                if not album_folder.is_dir():
-                    continue
-
-                parsed = parse_album_folder(album_folder.name)
-                if parsed:
-                    year, title = parsed
-                    albums.append(Album(year=year, title=title, path=album_folder))
-
-            if albums:
-                artists[normalized_name] = Artist(
-                    name=normalized_name,
-                    canonical_name=artist_name,
-                    albums=albums,
-                    path=artist_folder,
-                )
+    signature = _library_signature(library_path)
+
+    if not refresh and signature is not None and cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                cached_signature, artists = pickle.load(f)
+            if cached_signature == signature:
+                return artists
+        except Exception:
+            pass  # Corrupt or stale-format cache: fall through to rescan
+
+    artists = scan_library(library_path)
+
+    if signature is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump((signature, artists), f)
+        except OSError:
+            pass  # Cache is best-effort; the scan result still stands
 
     return artists
 
@@ -127,7 +292,7 @@ def parse_new_folder(folder_name: str) -> tuple[str, int, str] | None:
 
     Returns (artist, year, title) tuple or None if parsing fails.
     """
-    match = re.match(r"^(.+?)\s*-\s*\[(\d{4})\]\s*(.+)$", folder_name)
+    match = _NEW_FOLDER_RE.fullmatch(folder_name)
     if match:
         return match.group(1).strip(), int(match.group(2)), match.group(3).strip()
     return None
@@ -157,6 +322,29 @@ def get_artist_path(artist_name: str, library_path: Path | None = None) -> Path:
     return library_path / letter / normalized
 
 
+@lru_cache(maxsize=8)
+def _artist_index(artists: tuple[str, ...]) -> tuple[list[str], dict[str, str]]:
+    """Cached body of build_artist_index, keyed by the artist tuple."""
+    lower_to_original = {a.lower(): a for a in artists}
+    return list(lower_to_original.keys()), lower_to_original
+
+
+def build_artist_index(artists) -> tuple[list[str], dict[str, str]]:
+    """Build the lowercase matching index for a list of artist names.
+
+    Matching the same library repeatedly (discover over many artists, a
+    track import) would otherwise rebuild the lowercase mapping on every
+    call; the index is cached per distinct artist list.
+
+    Args:
+        artists: Iterable of artist names.
+
+    Returns:
+        Tuple of (lowercase names, lowercase-to-original mapping).
+    """
+    return _artist_index(tuple(artists))
+
+
 def find_matching_artist(query: str, artists: list[str], threshold: int = 80) -> str | None:
     """Find best matching artist using fuzzy matching.
 
@@ -171,9 +359,10 @@ def find_matching_artist(query: str, artists: list[str], threshold: int = 80) ->
     if not artists:
         return None
 
-    # Create lowercase mapping to handle case-insensitive matching
-    lower_to_original = {a.lower(): a for a in artists}
-    lower_artists = list(lower_to_original.keys())
+    from rapidfuzz import fuzz, process
+
+    # Lowercase index handles case-insensitive matching, cached across calls
+    lower_artists, lower_to_original = build_artist_index(artists)
 
     # Use token_set_ratio for word order independence
     result = process.extractOne(
@@ -186,3 +375,76 @@ def find_matching_artist(query: str, artists: list[str], threshold: int = 80) ->
     if result:
         return lower_to_original[result[0]]
     return None
+
+
+def find_matching_artists(
+    queries: list[str], artists: list[str], threshold: int = 80
+) -> dict[str, str | None]:
+    """Fuzzy-match a batch of queries against one artist list.
+
+    Builds the matching index once for the whole batch instead of per
+    query; scoring itself runs in rapidfuzz's C++ extractOne.
+
+    Args:
+        queries: Artist names to search for.
+        artists: List of artist names to match against.
+        threshold: Minimum score (0-100) to consider a match.
+
+    Returns:
+        Dict mapping each query to its best match, or None where no
+        candidate scored at or above threshold.
+    """
+    if not artists:
+        return {query: None for query in queries}
+
+    from rapidfuzz import fuzz, process
+
+    lower_artists, lower_to_original = build_artist_index(artists)
+
+    results: dict[str, str | None] = {}
+    for query in queries:
+        result = process.extractOne(
+            query.lower(),
+            lower_artists,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=threshold,
+        )
+        results[query] = lower_to_original[result[0]] if result else None
+    return results
+
+
+def find_artist_with_suggestions(
+    query: str, artists, threshold: int = 80
+) -> tuple[str | None, list[str]]:
+    """Find the best fuzzy match and closest alternatives in one pass.
+
+    Equivalent to find_matching_artist followed by a separate suggestion
+    scan on failure, but scores every candidate only once — the string
+    similarity work dominates on large libraries.
+
+    Args:
+        query: Artist name to search for.
+        artists: Iterable of artist names to match against.
+        threshold: Minimum score (0-100) to consider a match.
+
+    Returns:
+        Tuple of (match, suggestions): match is the best artist name at or
+        above threshold (suggestions empty), or None with up to three
+        closest names as suggestions.
+    """
+    lower_artists, lower_to_original = build_artist_index(artists)
+    if not lower_artists:
+        return None, []
+
+    from rapidfuzz import fuzz, process
+
+    matches = process.extract(
+        query.lower(),
+        lower_artists,
+        scorer=fuzz.token_set_ratio,
+        limit=3,
+    )
+
+    if matches and matches[0][1] >= threshold:
+        return lower_to_original[matches[0][0]], []
+    return None, [lower_to_original[name] for name, _, _ in matches]
@@ -1,20 +1,70 @@
 """Lyrics fetching from LRCLIB and Genius."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# From the speed extra, like lxml below; a Genius search response runs
+# to tens of KB and orjson cuts its parse cost several-fold
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from .config import GENIUS_API_KEY
 
+# lxml parses several times faster than the stdlib html.parser; it is in
+# the optional "speed" extra, so fall back when it isn't installed
+try:
+    import lxml  # noqa: F401
+
+    _SOUP_PARSER = "lxml"
+except ImportError:
+    _SOUP_PARSER = "html.parser"
+
 LRCLIB_API_URL = "https://lrclib.net/api/get"
 GENIUS_API_URL = "https://api.genius.com"
 
+# Only the lyrics containers matter on a Genius song page; straining
+# during the parse skips tree-building for the rest of the document
+_LYRICS_STRAINER = SoupStrainer(attrs={"data-lyrics-container": "true"})
+
+# Synced-lyrics timestamps like [00:23.45], compiled once
+_LRC_TS_RE = re.compile(r"\[\d{2}:\d{2}\.\d{2}\]\s*")
+
+# Per-run memo of get_lyrics results keyed by (artist, title, album):
+# re-processing the same album (retry, re-scan) repeats identical
+# lookups, and each one is at least an HTTPS round trip
+_memo: dict[tuple, tuple[str | None, str]] = {}
+
+
+def _lrclib_lookup(client: httpx.Client, params: dict) -> str | None:
+    """Run one LRCLIB query on the given client."""
+    response = client.get(LRCLIB_API_URL, params=params)
+
+    if response.status_code != 200:
+        return None
+
+    data = _json_loads(response.content)
+    # Prefer plain lyrics, fall back to synced lyrics stripped of timestamps
+    plain = data.get("plainLyrics")
+    if plain:
+        return plain
+
+    synced = data.get("syncedLyrics")
+    if synced:
+        return _LRC_TS_RE.sub("", synced)
+
+    return None
+
 
 def get_lyrics_from_lrclib(
     artist: str,
     title: str,
     album: str | None = None,
+    client: httpx.Client | None = None,
 ) -> str | None:
     """Fetch plain lyrics from LRCLIB.
 
@@ -22,6 +72,8 @@ def get_lyrics_from_lrclib(
         artist: Artist name.
         title: Track title.
         album: Album name (optional, improves matching).
+        client: Shared httpx client. Callers fetching several tracks
+            should pass one so the keep-alive connection is reused.
 
     Returns:
         Plain lyrics text, or None if not found.
@@ -34,32 +86,88 @@ def get_lyrics_from_lrclib(
         if album:
             params["album_name"] = album
 
+        if client is not None:
+            return _lrclib_lookup(client, params)
         with httpx.Client(timeout=10) as client:
-            response = client.get(LRCLIB_API_URL, params=params)
+            return _lrclib_lookup(client, params)
+    except Exception:
+        return None
 
-            if response.status_code != 200:
-                return None
 
-            data = response.json()
-            # Prefer plain lyrics, fall back to synced lyrics stripped of timestamps
-            plain = data.get("plainLyrics")
-            if plain:
-                return plain
+def _genius_lookup(
+    client: httpx.Client, artist: str, title: str, api_key: str
+) -> str | None:
+    """Search Genius and scrape the matched song page on the given client."""
+    response = client.get(
+        f"{GENIUS_API_URL}/search",
+        params={"q": f"{artist} {title}"},
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+
+    if response.status_code != 200:
+        return None
 
-            synced = data.get("syncedLyrics")
-            if synced:
-                # Strip timestamps like [00:23.45]
-                return re.sub(r"\[\d{2}:\d{2}\.\d{2}\]\s*", "", synced)
+    data = _json_loads(response.content)
+    hits = data.get("response", {}).get("hits", [])
 
-            return None
-    except Exception:
+    if not hits:
+        return None
+
+    # Find best match - look for matching artist
+    song_url = None
+    artist_lower = artist.lower()
+    for hit in hits:
+        result = hit.get("result", {})
+        primary_artist = result.get("primary_artist", {}).get("name", "").lower()
+        if artist_lower in primary_artist or primary_artist in artist_lower:
+            song_url = result.get("url")
+            break
+
+    # Fall back to first result if no artist match
+    if not song_url and hits:
+        song_url = hits[0].get("result", {}).get("url")
+
+    if not song_url:
+        return None
+
+    # Scrape lyrics from the song page
+    response = client.get(song_url, follow_redirects=True)
+    if response.status_code != 200:
         return None
 
+    soup = BeautifulSoup(response.text, _SOUP_PARSER, parse_only=_LYRICS_STRAINER)
+
+    # Genius uses data-lyrics-container attribute for lyrics
+    lyrics_containers = soup.find_all(attrs={"data-lyrics-container": "true"})
+    if lyrics_containers:
+        lyrics_parts = []
+        for container in lyrics_containers:
+            # Remove header divs that contain metadata (contributors, etc.)
+            for header in container.find_all(
+                class_=lambda c: c and "LyricsHeader" in str(c)
+            ):
+                header.decompose()
+
+            # Get text, replacing <br> with newlines
+            for br in container.find_all("br"):
+                br.replace_with("\n")
+            text = container.get_text()
+
+            # Skip empty containers
+            if len(text.strip()) < 10:
+                continue
+
+            lyrics_parts.append(text)
+        return "\n".join(lyrics_parts).strip()
+
+    return None
+
 
 def get_lyrics_from_genius(
     artist: str,
     title: str,
     api_key: str | None = None,
+    client: httpx.Client | None = None,
 ) -> str | None:
     """Fetch lyrics from Genius.
 
@@ -67,6 +175,7 @@ def get_lyrics_from_genius(
         artist: Artist name.
         title: Track title.
         api_key: Genius API key. If None, uses GENIUS_API_KEY from config/env.
+        client: Shared httpx client (see get_lyrics_from_lrclib).
 
     Returns:
         Lyrics text, or None if not found.
@@ -78,71 +187,10 @@ def get_lyrics_from_genius(
         return None
 
     try:
-        # Search for the song
+        if client is not None:
+            return _genius_lookup(client, artist, title, api_key)
         with httpx.Client(timeout=10) as client:
-            response = client.get(
-                f"{GENIUS_API_URL}/search",
-                params={"q": f"{artist} {title}"},
-                headers={"Authorization": f"Bearer {api_key}"},
-            )
-
-            if response.status_code != 200:
-                return None
-
-            data = response.json()
-            hits = data.get("response", {}).get("hits", [])
-
-            if not hits:
-                return None
-
-            # Find best match - look for matching artist
-            song_url = None
-            artist_lower = artist.lower()
-            for hit in hits:
-                result = hit.get("result", {})
-                primary_artist = result.get("primary_artist", {}).get("name", "").lower()
-                if artist_lower in primary_artist or primary_artist in artist_lower:
-                    song_url = result.get("url")
-                    break
-
-            # Fall back to first result if no artist match
-            if not song_url and hits:
-                song_url = hits[0].get("result", {}).get("url")
-
-            if not song_url:
-                return None
-
-            # Scrape lyrics from the song page
-            response = client.get(song_url, follow_redirects=True)
-            if response.status_code != 200:
-                return None
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Genius uses data-lyrics-container attribute for lyrics
-            lyrics_containers = soup.find_all(attrs={"data-lyrics-container": "true"})
-            if lyrics_containers:
-                lyrics_parts = []
-                for container in lyrics_containers:
-                    # Remove header divs that contain metadata (contributors, etc.)
-                    for header in container.find_all(
-                        class_=lambda c: c and "LyricsHeader" in str(c)
-                    ):
-                        header.decompose()
-
-                    # Get text, replacing <br> with newlines
-                    for br in container.find_all("br"):
-                        br.replace_with("\n")
-                    text = container.get_text()
-
-                    # Skip empty containers
-                    if len(text.strip()) < 10:
-                        continue
-
-                    lyrics_parts.append(text)
-                return "\n".join(lyrics_parts).strip()
-
-            return None
+            return _genius_lookup(client, artist, title, api_key)
     except Exception:
         return None
 
@@ -152,26 +200,80 @@ def get_lyrics(
     title: str,
     album: str | None = None,
     genius_api_key: str | None = None,
+    client: httpx.Client | None = None,
 ) -> tuple[str | None, str]:
     """Fetch lyrics, trying LRCLIB first then Genius.
 
+    Results are memoized per run, and both sources share one client so a
+    LRCLIB miss falls through to Genius on the same pooled connection.
+
     Args:
         artist: Artist name.
         title: Track title.
         album: Album name (optional).
         genius_api_key: Genius API key for fallback.
+        client: Shared httpx client; callers fetching a whole album
+            should pass one so every track reuses it.
 
     Returns:
         Tuple of (lyrics, source) where source is "lrclib", "genius", or "none".
     """
-    # Try LRCLIB first
-    lyrics = get_lyrics_from_lrclib(artist, title, album)
-    if lyrics:
-        return lyrics, "lrclib"
+    key = (artist, title, album)
+    cached = _memo.get(key)
+    if cached is not None:
+        return cached
+
+    own_client = None
+    if client is None:
+        own_client = client = httpx.Client(timeout=10)
+    try:
+        lyrics = get_lyrics_from_lrclib(artist, title, album, client=client)
+        if lyrics:
+            result = (lyrics, "lrclib")
+        else:
+            lyrics = get_lyrics_from_genius(
+                artist, title, genius_api_key, client=client
+            )
+            result = (lyrics, "genius") if lyrics else (None, "none")
+    finally:
+        if own_client is not None:
+            own_client.close()
 
-    # Fall back to Genius
-    lyrics = get_lyrics_from_genius(artist, title, genius_api_key)
-    if lyrics:
-        return lyrics, "genius"
+    _memo[key] = result
+    return result
 
-    return None, "none"
+
+def get_lyrics_batch(
+    tracks: list[tuple[str, str]],
+    album: str | None = None,
+    genius_api_key: str | None = None,
+) -> dict[tuple[str, str], tuple[str | None, str]]:
+    """Fetch lyrics for several tracks concurrently.
+
+    Each track's LRCLIB-then-Genius chain stays sequential, but distinct
+    tracks fan out across a small thread pool sharing one pooled client,
+    so an album's lookups take roughly one round trip instead of one per
+    track. The pool is capped at six in-flight requests to stay polite
+    to both APIs.
+
+    Args:
+        tracks: (artist, title) pairs to look up.
+        album: Album name shared by the tracks (optional).
+        genius_api_key: Genius API key for fallback.
+
+    Returns:
+        Dict mapping each (artist, title) pair to its (lyrics, source)
+        tuple as returned by get_lyrics.
+    """
+    if not tracks:
+        return {}
+
+    with httpx.Client(timeout=10) as client:
+        with ThreadPoolExecutor(max_workers=min(6, len(tracks))) as executor:
+            fetched = executor.map(
+                lambda t: get_lyrics(
+                    t[0], t[1], album, genius_api_key, client=client
+                ),
+                tracks,
+            )
+            return dict(zip(tracks, fetched))
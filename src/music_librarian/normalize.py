@@ -1,9 +1,30 @@
 """Volume normalization using rsgain."""
 
+import os
 import re
 import subprocess
 from pathlib import Path
 
+# rsgain's album summary block, shared by custom and easy mode output
+_ALBUM_RE = re.compile(
+    r"Album:\s*\n"
+    r"\s*Loudness:\s*([-\d.]+)\s*LUFS\s*\n"
+    r"\s*Peak:\s*([-\d.]+)\s*\(([-\d.]+)\s*dB\)\s*\n"
+    r"\s*Gain:\s*([-\d.]+)\s*dB"
+)
+
+def _parse_gain_info(output: str) -> dict | None:
+    """Extract album gain figures from an rsgain output block."""
+    match = _ALBUM_RE.search(output)
+    if not match:
+        return None
+    return {
+        "loudness": float(match.group(1)),
+        "peak": float(match.group(2)),
+        "peak_db": float(match.group(3)),
+        "gain": float(match.group(4)),
+    }
+
 
 def normalize_album(album_path: Path) -> dict | None:
     """Apply ReplayGain tags to an album using rsgain.
@@ -34,23 +55,62 @@ def normalize_album(album_path: Path) -> dict | None:
 
     # Parse album gain info from output
     output = result.stdout + result.stderr
-    album_info = {}
-
-    # Look for album section and extract values
-    album_match = re.search(
-        r"Album:\s*\n"
-        r"\s*Loudness:\s*([-\d.]+)\s*LUFS\s*\n"
-        r"\s*Peak:\s*([-\d.]+)\s*\(([-\d.]+)\s*dB\)\s*\n"
-        r"\s*Gain:\s*([-\d.]+)\s*dB",
-        output,
-    )
-
-    if album_match:
-        album_info = {
-            "loudness": float(album_match.group(1)),
-            "peak": float(album_match.group(2)),
-            "peak_db": float(album_match.group(3)),
-            "gain": float(album_match.group(4)),
-        }
-
-    return album_info
+    return _parse_gain_info(output) or {}
+
+
+def normalize_albums(album_paths: list[Path]) -> dict[Path, dict | None]:
+    """Apply ReplayGain tags to several albums via rsgain easy mode.
+
+    Easy mode takes one directory per invocation, treats it as an album,
+    and parallelizes decoding internally via -m — so an album finishes in
+    roughly one track's scan time instead of the serial per-track cost
+    custom mode pays. Each album's output is parsed on its own, with no
+    assumptions about how easy mode interleaves a multi-directory log.
+
+    Args:
+        album_paths: Album folders to normalize.
+
+    Returns:
+        Dict mapping each path to its album gain info (as returned by
+        normalize_album), or None where rsgain produced no figures.
+
+    Raises:
+        subprocess.CalledProcessError: If any rsgain invocation fails.
+            Remaining albums are still processed first, and the error
+            carries rsgain's stderr.
+    """
+    for album_path in album_paths:
+        if not album_path.exists():
+            raise FileNotFoundError(f"Album path does not exist: {album_path}")
+        if not album_path.is_dir():
+            raise ValueError(f"Album path must be a directory: {album_path}")
+
+    results: dict[Path, dict | None] = {path: None for path in album_paths}
+
+    # Finish the batch before raising so one bad album doesn't abandon
+    # the rest untagged; surface the first failure afterwards (the same
+    # shape convert_album uses for its encoder children)
+    failure: subprocess.CalledProcessError | None = None
+    for album_path in album_paths:
+        cmd = [
+            "rsgain",
+            "easy",
+            "-m",
+            str(os.cpu_count() or 1),
+            str(album_path),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            if failure is None:
+                failure = subprocess.CalledProcessError(
+                    result.returncode, cmd, stderr=result.stderr
+                )
+            continue
+
+        results[album_path] = _parse_gain_info(result.stdout + result.stderr)
+
+    if failure is not None:
+        raise failure
+
+    return results
@@ -5,7 +5,8 @@ import hashlib
 import re
 import subprocess
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import httpx
@@ -52,73 +53,214 @@ EDITION_MARKER_PATTERNS = [
     r"\s*\.\.\.and\s+more\s*$",
 ]
 
+# Compiled once at import: re.sub on a raw string re-checks the pattern cache
+# on every call, and these run against two tags per track during cleanup.
+# Kept as a list (not one alternation) because the patterns are applied
+# sequentially — trailing-anchor patterns can match text exposed by an
+# earlier substitution.
+_EDITION_MARKER_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in EDITION_MARKER_PATTERNS
+]
 
-def _is_compilation_or_live(title: str) -> bool:
-    """Check if album title indicates a compilation or live album."""
-    title_lower = title.lower()
+# The same markers fused into one alternation for callers that only strip
+# (no per-pattern capture groups needed). One sub() walks the title once
+# instead of 24 times; _normalize_album_title re-applies it until nothing
+# changes so a trailing marker exposed by an earlier strip still goes.
+# No IGNORECASE: the input is lowercased first, so the engine can skip
+# per-character case folding.
+_EDITION_MARKER_FUSED_RE = re.compile(
+    "|".join(f"(?:{p})" for p in EDITION_MARKER_PATTERNS)
+)
+
+# Cheap substring prefilter: every pattern in EDITION_MARKER_PATTERNS
+# requires at least one of these words, so titles containing none of them
+# (the overwhelming majority) can skip the regex passes entirely.
+# Single words only — the patterns allow flexible whitespace (\s+), so a
+# multi-word literal like "and more" would miss "...and  more" and
+# silently disable stripping the regexes still match.
+_EDITION_TRIGGERS = (
+    "deluxe",
+    "remaster",
+    "expanded",
+    "anniversary",
+    "special",
+    "edition",
+    "version",
+    "bonus",
+    "mix",
+    "release",
+    "explicit",
+    "clean",
+    "stereo",
+    "mono",
+    "more",
+    "white",
+)
+
+# Optional Hyperscan prefilter (pip install hyperscan). Compiles all marker
+# patterns into one multi-pattern database scanned in a single pass, so bulk
+# metadata cleanup can skip the sequential re.sub passes for the common case
+# of titles with no markers. Purely an accelerator: stripping still goes
+# through the re patterns above, so behavior is identical without it.
+try:
+    import hyperscan
+
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[p.encode() for p in EDITION_MARKER_PATTERNS],
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(EDITION_MARKER_PATTERNS),
+    )
+except Exception:
+    _HS_DB = None
+
+
+def _has_edition_marker(title: str) -> bool:
+    """Check whether any edition marker pattern could match the title.
+
+    Uses the Hyperscan database when available; otherwise returns True so
+    callers fall through to the full regex passes.
+    """
+    if _HS_DB is None:
+        return True
 
-    # Greatest hits / compilation patterns
-    compilation_patterns = [
-        r"\bgreatest\s+hits\b",
-        r"\bbest\s+of\b",
-        r"\bessential\b",
-        r"\bcollection\b",
-        r"\banthology\b",
-        r"\bretrospective\b",
-        r"\bcompilation\b",
-        r"\bcomplete\s+recordings\b",
-        r"\bdefinitive\b",
-        r"\bultimate\b",
-        r"\bsingles\b",
-        r"\bhits\b",
-        r"\bfavorites\b",
-        r"\brarities\b",
-        r"\bouttakes\b",
-        r"\bbox\s*set\b",
-        r"\bbox\b.*\bset\b",
-        r"\bthe\s+.+\s+box\s*$",  # "The ... Box" at end of title
-    ]
+    found = False
 
-    # Live album patterns
-    live_patterns = [
-        r"\blive\b",
-        r"\bin\s+concert\b",
-        r"\bunplugged\b",
-        r"\bacoustic\s+live\b",
-        r"\blive\s+at\b",
-        r"\blive\s+from\b",
-        r"\blive\s+in\b",
-        r"\bstop\s+making\s+sense\b",  # Famous Talking Heads concert film
-        r"\bname\s+of\s+this\s+band\b",  # "The Name of This Band Is..." live album
-    ]
+    def _on_match(pattern_id, start, end, flags, context):
+        nonlocal found
+        found = True
+        return 1  # Stop scanning on first match
 
-    for pattern in compilation_patterns + live_patterns:
-        if re.search(pattern, title_lower):
-            return True
+    try:
+        _HS_DB.scan(title.encode(), match_event_handler=_on_match)
+    except Exception:
+        return True
+    return found
+
+
+# Greatest hits / compilation patterns
+_COMPILATION_PATTERNS = [
+    r"\bgreatest\s+hits\b",
+    r"\bbest\s+of\b",
+    r"\bessential\b",
+    r"\bcollection\b",
+    r"\banthology\b",
+    r"\bretrospective\b",
+    r"\bcompilation\b",
+    r"\bcomplete\s+recordings\b",
+    r"\bdefinitive\b",
+    r"\bultimate\b",
+    r"\bsingles\b",
+    r"\bhits\b",
+    r"\bfavorites\b",
+    r"\brarities\b",
+    r"\bouttakes\b",
+    r"\bbox\s*set\b",
+    r"\bbox\b.*\bset\b",
+    r"\bthe\s+.+\s+box\s*$",  # "The ... Box" at end of title
+]
+
+# Live album patterns
+_LIVE_PATTERNS = [
+    r"\blive\b",
+    r"\bin\s+concert\b",
+    r"\bunplugged\b",
+    r"\bacoustic\s+live\b",
+    r"\blive\s+at\b",
+    r"\blive\s+from\b",
+    r"\blive\s+in\b",
+    r"\bstop\s+making\s+sense\b",  # Famous Talking Heads concert film
+    r"\bname\s+of\s+this\s+band\b",  # "The Name of This Band Is..." live album
+]
 
-    return False
+# Fused into a single alternation: detection only needs "does any
+# pattern match", so one engine pass over the title replaces 27
+# separate scans — most titles match nothing and paid all of them
+_COMPILATION_LIVE_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _COMPILATION_PATTERNS + _LIVE_PATTERNS)
+)
+
+# Substring prefilter, same idea as _EDITION_TRIGGERS: every pattern
+# above requires one of these literals, and C-level `in` is far cheaper
+# than the regex engine. A hit still needs the regex to confirm word
+# boundaries ("alive" contains "live" but isn't a live album). Single
+# words only, since the patterns match across flexible whitespace.
+_COMPILATION_LIVE_TRIGGERS = (
+    "greatest",
+    "best",
+    "essential",
+    "collection",
+    "anthology",
+    "retrospective",
+    "compilation",
+    "complete",
+    "definitive",
+    "ultimate",
+    "singles",
+    "hits",
+    "favorites",
+    "rarities",
+    "outtakes",
+    "box",
+    "live",
+    "concert",
+    "unplugged",
+    "making",
+    "band",
+)
+
+# Punctuation and whitespace normalization used by _normalize_album_title
+_PUNCT_RE = re.compile(r"[:'`'.,\u2018\u2019\u201c\u201d]")
+_WS_RE = re.compile(r"\s+")
+
+# Track-title suffixes stripped by _normalize_track_title: remaster/mono/
+# stereo annotations and year markers like "(2009 Mix)". Case-sensitive —
+# the helper lowercases its input before matching.
+_TRACK_TITLE_RES = [
+    re.compile(pattern)
+    for pattern in (
+        r"\s*\(remaster[^)]*\)",
+        r"\s*\(mono[^)]*\)",
+        r"\s*\(stereo[^)]*\)",
+        r"\s*\(\d{4}[^)]*\)",  # Year annotations
+    )
+]
 
 
+def _is_compilation_or_live(title: str) -> bool:
+    """Check if album title indicates a compilation or live album."""
+    title_lower = title.lower()
+    if not any(trigger in title_lower for trigger in _COMPILATION_LIVE_TRIGGERS):
+        return False
+    return _COMPILATION_LIVE_RE.search(title_lower) is not None
+
+
+@lru_cache(maxsize=4096)
 def _normalize_album_title(title: str) -> str:
     """Normalize album title for deduplication.
 
     Strips trailing whitespace, edition markers, and normalizes punctuation.
+    Cached: deduplication and the discover ignore filter normalize the
+    same titles several times per run, and each call is a regex pass.
     """
     normalized = title.lower().strip()
 
-    # Remove edition markers
-    for pattern in EDITION_MARKER_PATTERNS:
-        normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+    # Remove edition markers: one fused pass per round, repeated only in
+    # the rare case a strip exposes a new trailing marker
+    while True:
+        stripped = _EDITION_MARKER_FUSED_RE.sub("", normalized)
+        if stripped == normalized:
+            break
+        normalized = stripped
 
     # Normalize "&" to "and"
     normalized = normalized.replace("&", "and")
 
     # Normalize punctuation for matching
     # Replace colons, apostrophes (ASCII and Unicode), commas, and similar with spaces
-    normalized = re.sub(r"[:'`'.,\u2018\u2019\u201c\u201d]", " ", normalized)
+    normalized = _PUNCT_RE.sub(" ", normalized)
 
     # Collapse multiple spaces
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WS_RE.sub(" ", normalized)
 
     return normalized.strip()
 
@@ -138,16 +280,16 @@ def _deduplicate_albums(albums: list["QobuzAlbum"]) -> list["QobuzAlbum"]:
     4. If they differ and hi-fi has more tracks: use hi-fi URL but standard's
        year, and mark for track cleanup after download
     """
-    from collections import defaultdict
-
-    groups: dict[str, list[QobuzAlbum]] = defaultdict(list)
+    from itertools import groupby
 
-    for album in albums:
-        key = _normalize_album_title(album.title)
-        groups[key].append(album)
+    # Sort by normalized title and group adjacent runs rather than
+    # building a dict of per-key lists. normalized_title is cached on
+    # each album, so the sort and groupby key calls are attribute reads.
+    ordered = sorted(albums, key=lambda a: a.normalized_title)
 
     result = []
-    for group in groups.values():
+    for _, grouped in groupby(ordered, key=lambda a: a.normalized_title):
+        group = list(grouped)
         if len(group) == 1:
             result.append(group[0])
             continue
@@ -162,12 +304,10 @@ def _deduplicate_albums(albums: list["QobuzAlbum"]) -> list["QobuzAlbum"]:
             continue
 
         # Find standard edition: earliest year, then fewest tracks
-        standard = sorted(group, key=lambda a: (a.year, a.tracks_count))[0]
+        standard = min(group, key=lambda a: (a.year, a.tracks_count))
 
         # Find best fidelity: highest bit depth, then sample rate
-        best_fidelity = sorted(
-            group, key=lambda a: (-a.bit_depth, -a.sample_rate)
-        )[0]
+        best_fidelity = min(group, key=lambda a: (-a.bit_depth, -a.sample_rate))
 
         # Check if best fidelity is actually better
         is_higher_fidelity = (
@@ -186,7 +326,7 @@ def _deduplicate_albums(albums: list["QobuzAlbum"]) -> list["QobuzAlbum"]:
             # Mark for track cleanup if hi-fi has more tracks
             merged = QobuzAlbum(
                 id=best_fidelity.id,
-                title=_normalize_album_title(standard.title).title(),
+                title=standard.normalized_title.title(),
                 year=standard.year,
                 artist=best_fidelity.artist,
                 url=best_fidelity.url,
@@ -231,6 +371,22 @@ class QobuzAlbum:
     # For merged albums: standard edition info for post-download cleanup
     standard_track_count: int | None = None  # If set, delete tracks beyond this
     standard_id: str | None = None  # ID of standard edition for track list lookup
+    # Per-instance cache for normalized_title (see below)
+    _normalized_title: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def normalized_title(self) -> str:
+        """The title with edition markers stripped, computed once.
+
+        Dedup keys on this, the merged-title rebuild reads it, and the
+        discover pipeline normalizes every album again — caching on the
+        instance means the regex passes run at most once per album.
+        """
+        if self._normalized_title is None:
+            self._normalized_title = _normalize_album_title(self.title)
+        return self._normalized_title
 
 
 def get_qobuz_credentials(config_path: Path | None = None) -> tuple[str, str]:
@@ -282,6 +438,7 @@ def search_artist(
     artist_name: str,
     app_id: str | None = None,
     secret: str | None = None,
+    client: httpx.Client | None = None,
 ) -> dict | None:
     """Search for an artist on Qobuz.
 
@@ -289,6 +446,8 @@ def search_artist(
         artist_name: Artist name to search for.
         app_id: Qobuz app ID. If None, reads from config.
         secret: Qobuz secret. If None, reads from config.
+        client: Shared httpx client. Callers making several Qobuz calls
+            should pass one so the keep-alive connection is reused.
 
     Returns:
         Artist data dict or None if not found.
@@ -296,37 +455,42 @@ def search_artist(
     if app_id is None or secret is None:
         app_id, secret = get_qobuz_credentials()
 
-    # Get search variants (with and without "The")
-    variants = get_artist_search_variants(artist_name)
+    # Get search variants (with and without "The"), as a lowercase set so
+    # each candidate is one hash lookup instead of a loop over variants
+    variants_lower = frozenset(
+        v.lower() for v in get_artist_search_variants(artist_name)
+    )
 
-    with httpx.Client() as client:
+    own_client = None
+    if client is None:
+        own_client = client = httpx.Client()
+    try:
         response = client.get(
             "https://www.qobuz.com/api.json/0.2/artist/search",
             params={"query": artist_name, "limit": 20},
             headers=_get_auth_headers(app_id, secret),
         )
+    finally:
+        if own_client is not None:
+            own_client.close()
 
-        if response.status_code != 200:
-            return None
+    if response.status_code != 200:
+        return None
 
-        data = response.json()
-        artists = data.get("artists", {}).get("items", [])
-
-        # First, try exact match on any variant
-        for artist in artists:
-            name = artist.get("name", "").lower()
-            for variant in variants:
-                if name == variant.lower():
-                    return artist
-
-        # If no exact match, try prefix match with "The" (e.g., "The Black Keys")
-        for artist in artists:
-            name = artist.get("name", "").lower()
-            if name.startswith("the "):
-                name_without_the = name[4:]
-                for variant in variants:
-                    if name_without_the == variant.lower():
-                        return artist
+    data = response.json()
+    artists = data.get("artists", {}).get("items", [])
+
+    # First, try exact match on any variant
+    for artist in artists:
+        name = artist.get("name", "").lower()
+        if name in variants_lower:
+            return artist
+
+    # If no exact match, try prefix match with "The" (e.g., "The Black Keys")
+    for artist in artists:
+        name = artist.get("name", "").lower()
+        if name.startswith("the ") and name[4:] in variants_lower:
+            return artist
 
     return None
 
@@ -336,6 +500,7 @@ def get_artist_albums(
     app_id: str | None = None,
     secret: str | None = None,
     albums_only: bool = True,
+    client: httpx.Client | None = None,
 ) -> list[QobuzAlbum]:
     """Get all albums for an artist from Qobuz.
 
@@ -344,6 +509,7 @@ def get_artist_albums(
         app_id: Qobuz app ID. If None, reads from config.
         secret: Qobuz secret. If None, reads from config.
         albums_only: If True, exclude singles and EPs (< MIN_ALBUM_TRACKS tracks).
+        client: Shared httpx client (see search_artist).
 
     Returns:
         List of QobuzAlbum objects.
@@ -353,7 +519,10 @@ def get_artist_albums(
 
     albums: list[QobuzAlbum] = []
 
-    with httpx.Client() as client:
+    own_client = None
+    if client is None:
+        own_client = client = httpx.Client()
+    try:
         response = client.get(
             "https://www.qobuz.com/api.json/0.2/artist/get",
             params={
@@ -363,59 +532,62 @@ def get_artist_albums(
             },
             headers=_get_auth_headers(app_id, secret),
         )
+    finally:
+        if own_client is not None:
+            own_client.close()
 
-        if response.status_code == 200:
-            data = response.json()
-            artist_name = data.get("name", "Unknown")
+    if response.status_code == 200:
+        data = response.json()
+        artist_name = data.get("name", "Unknown")
 
-            for album_data in data.get("albums", {}).get("items", []):
-                # Skip compilations and appearances
-                if album_data.get("artist", {}).get("id") != int(artist_id):
-                    continue
+        for album_data in data.get("albums", {}).get("items", []):
+            # Skip compilations and appearances
+            if album_data.get("artist", {}).get("id") != int(artist_id):
+                continue
 
-                tracks_count = album_data.get("tracks_count", 0) or 0
-
-                # Skip singles/EPs if albums_only is True
-                if albums_only:
-                    # Check API release type field
-                    release_type = album_data.get("product_type") or album_data.get("release_type") or ""
-                    if release_type.lower() in ("single", "ep", "epmini"):
-                        continue
-                    # Fallback: skip if too few tracks (API may not always provide release type)
-                    if tracks_count < MIN_ALBUM_TRACKS:
-                        continue
-
-                # Skip compilations and live albums
-                title = album_data.get("title", "")
-                if _is_compilation_or_live(title):
+            tracks_count = album_data.get("tracks_count", 0) or 0
+
+            # Skip singles/EPs if albums_only is True
+            if albums_only:
+                # Check API release type field
+                release_type = album_data.get("product_type") or album_data.get("release_type") or ""
+                if release_type.lower() in ("single", "ep", "epmini"):
+                    continue
+                # Fallback: skip if too few tracks (API may not always provide release type)
+                if tracks_count < MIN_ALBUM_TRACKS:
                     continue
 
-                # Parse year from release_date_original (format: YYYY-MM-DD)
-                release_date = album_data.get("release_date_original", "")
-                year = 0
-                if release_date and len(release_date) >= 4:
-                    try:
-                        year = int(release_date[:4])
-                    except ValueError:
-                        pass
-
-                bit_depth = album_data.get("maximum_bit_depth", 16) or 16
-                sample_rate = album_data.get("maximum_sampling_rate", 44.1) or 44.1
-                popularity = album_data.get("popularity", 0) or 0
-
-                albums.append(
-                    QobuzAlbum(
-                        id=str(album_data.get("id", "")),
-                        title=album_data.get("title", "Unknown"),
-                        year=year,
-                        artist=artist_name,
-                        url=f"https://www.qobuz.com/album/{album_data.get('id', '')}",
-                        tracks_count=tracks_count,
-                        bit_depth=bit_depth,
-                        sample_rate=sample_rate,
-                        popularity=popularity,
-                    )
+            # Skip compilations and live albums
+            title = album_data.get("title", "")
+            if _is_compilation_or_live(title):
+                continue
+
+            # Parse year from release_date_original (format: YYYY-MM-DD)
+            release_date = album_data.get("release_date_original", "")
+            year = 0
+            if release_date and len(release_date) >= 4:
+                try:
+                    year = int(release_date[:4])
+                except ValueError:
+                    pass
+
+            bit_depth = album_data.get("maximum_bit_depth", 16) or 16
+            sample_rate = album_data.get("maximum_sampling_rate", 44.1) or 44.1
+            popularity = album_data.get("popularity", 0) or 0
+
+            albums.append(
+                QobuzAlbum(
+                    id=str(album_data.get("id", "")),
+                    title=album_data.get("title", "Unknown"),
+                    year=year,
+                    artist=artist_name,
+                    url=f"https://www.qobuz.com/album/{album_data.get('id', '')}",
+                    tracks_count=tracks_count,
+                    bit_depth=bit_depth,
+                    sample_rate=sample_rate,
+                    popularity=popularity,
                 )
+            )
 
     # Deduplicate albums: prefer higher fidelity, then fewer tracks (standard edition)
     return _deduplicate_albums(albums)
@@ -434,11 +606,14 @@ def discover_missing_albums(
     Returns:
         List of QobuzAlbum objects not in local library.
     """
-    artist = search_artist(artist_name)
-    if not artist:
-        return []
+    # One client for the search and the album fetch, so the second call
+    # rides the already-open keep-alive connection to the Qobuz API
+    with httpx.Client() as client:
+        artist = search_artist(artist_name, client=client)
+        if not artist:
+            return []
 
-    qobuz_albums = get_artist_albums(str(artist["id"]))
+        qobuz_albums = get_artist_albums(str(artist["id"]), client=client)
 
     # Normalize existing album titles for comparison (strip edition markers)
     existing_normalized = {
@@ -447,8 +622,7 @@ def discover_missing_albums(
 
     missing = []
     for album in qobuz_albums:
-        normalized_title = _normalize_album_title(album.title)
-        if normalized_title not in existing_normalized:
+        if album.normalized_title not in existing_normalized:
             missing.append(album)
 
     return missing
@@ -458,6 +632,7 @@ def get_album_tracks(
     album_id: str,
     app_id: str | None = None,
     secret: str | None = None,
+    client: httpx.Client | None = None,
 ) -> list[str]:
     """Get track titles for an album.
 
@@ -465,6 +640,7 @@ def get_album_tracks(
         album_id: Qobuz album ID.
         app_id: Qobuz app ID. If None, reads from config.
         secret: Qobuz secret. If None, reads from config.
+        client: Shared httpx client (see search_artist).
 
     Returns:
         List of track titles in order.
@@ -472,23 +648,29 @@ def get_album_tracks(
     if app_id is None or secret is None:
         app_id, secret = get_qobuz_credentials()
 
-    with httpx.Client() as client:
+    own_client = None
+    if client is None:
+        own_client = client = httpx.Client()
+    try:
         response = client.get(
             "https://www.qobuz.com/api.json/0.2/album/get",
             params={"album_id": album_id},
             headers=_get_auth_headers(app_id, secret),
         )
+    finally:
+        if own_client is not None:
+            own_client.close()
 
-        if response.status_code != 200:
-            return []
+    if response.status_code != 200:
+        return []
 
-        data = response.json()
-        tracks = []
-        for track in data.get("tracks", {}).get("items", []):
-            title = track.get("title", "")
-            if title:
-                tracks.append(title)
-        return tracks
+    data = response.json()
+    tracks = []
+    for track in data.get("tracks", {}).get("items", []):
+        title = track.get("title", "")
+        if title:
+            tracks.append(title)
+    return tracks
 
 
 def get_album_artwork_url(
@@ -574,18 +756,17 @@ def download_standard_artwork(album_path: Path, standard_id: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def _normalize_track_title(title: str) -> str:
-    """Normalize track title for matching."""
+    """Normalize track title for matching.
+
+    Cached like _normalize_album_title: bonus-track cleanup normalizes
+    the same titles for both the standard and downloaded track lists.
+    """
     # Remove common suffixes like "(Remastered)", version info, etc.
     normalized = title.lower().strip()
-    patterns = [
-        r"\s*\(remaster[^)]*\)",
-        r"\s*\(mono[^)]*\)",
-        r"\s*\(stereo[^)]*\)",
-        r"\s*\(\d{4}[^)]*\)",  # Year annotations
-    ]
-    for pattern in patterns:
-        normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+    for pattern in _TRACK_TITLE_RES:
+        normalized = pattern.sub("", normalized)
     return normalized.strip()
 
 
@@ -642,9 +823,21 @@ def _strip_edition_markers(title: str) -> str:
 
     Removes markers like (Deluxe Edition), (Remastered 2023), etc.
     """
+    lowered = title.casefold()
+    if not any(trigger in lowered for trigger in _EDITION_TRIGGERS):
+        return title
+
+    if not _has_edition_marker(title):
+        return title
+
     result = title
-    for pattern in EDITION_MARKER_PATTERNS:
-        result = re.sub(pattern, "", result, flags=re.IGNORECASE)
+    for pattern in _EDITION_MARKER_RES:
+        result = pattern.sub("", result)
+
+    # re.sub returns the original object when nothing matched; the strip
+    # allocation is only needed when a marker was actually removed
+    if result is title:
+        return title
     return result.strip()
 
 
@@ -654,13 +847,28 @@ def _extract_edition_markers(title: str) -> str | None:
     Returns the edition marker text (e.g., "Deluxe Edition") or None if not found.
     Only extracts from patterns that have a capture group (meaningful edition info).
     """
-    for pattern in EDITION_MARKER_PATTERNS:
-        match = re.search(pattern, title, flags=re.IGNORECASE)
+    lowered = title.casefold()
+    if not any(trigger in lowered for trigger in _EDITION_TRIGGERS):
+        return None
+
+    for pattern in _EDITION_MARKER_RES:
+        match = pattern.search(title)
         if match and match.lastindex:  # Has a capture group
             return match.group(1).strip()
     return None
 
 
+def _metadata_padding(padding_info) -> int:
+    """Padding strategy for pipeline saves.
+
+    Keep whatever padding the file already has, but reserve at least 8 KiB
+    so the later passes (lyrics, ReplayGain tags) can usually rewrite the
+    metadata block in place instead of shifting the entire audio payload —
+    each such shift is a full-file rewrite.
+    """
+    return max(padding_info.padding, 8192)
+
+
 def _append_comment(audio: FLAC, new_comment: str) -> None:
     """Append a comment to the FLAC file's comment tag."""
     existing = audio.get("comment", [""])[0]
@@ -670,20 +878,32 @@ def _append_comment(audio: FLAC, new_comment: str) -> None:
         audio["comment"] = [new_comment]
 
 
-def normalize_track_metadata(album_path: Path) -> int:
+def normalize_track_metadata(
+    album_path: Path,
+    genre: str | None = None,
+    flac_files: list[Path] | None = None,
+) -> int:
     """Normalize track metadata.
 
     For each FLAC file:
     - If Artist differs from Album Artist, stores original in Comment and overwrites
     - Strips edition markers from Album and Title tags
+    - Sets the Genre tag when one is provided
+
+    Accepting the genre here lets process_album apply it in the same
+    open/save pass as the other edits instead of rewriting every file a
+    second time.
 
     Args:
         album_path: Path to album folder.
+        genre: Genre to set on each track, if known.
+        flac_files: Pre-listed FLAC files, to avoid re-globbing.
 
     Returns:
         Number of tracks modified.
     """
-    flac_files = sorted(album_path.glob("*.flac"))
+    if flac_files is None:
+        flac_files = sorted(album_path.glob("*.flac"))
     track_total = str(len(flac_files))
     modified = 0
 
@@ -706,12 +926,15 @@ def normalize_track_metadata(album_path: Path) -> int:
             audio["artist"] = [album_artist]
             changed = True
 
-        # Strip edition markers from album title and save to comment
+        # Strip edition markers from album title and save to comment.
+        # Extraction re-runs the marker patterns, so only bother when
+        # stripping found something to remove — the common clean-album
+        # case then pays for a single pass.
         album_title = audio.get("album", [None])[0]
         if album_title:
-            edition_marker = _extract_edition_markers(album_title)
             clean_album = _strip_edition_markers(album_title)
             if clean_album != album_title:
+                edition_marker = _extract_edition_markers(album_title)
                 if edition_marker:
                     _append_comment(audio, f"Edition: {edition_marker}")
                 audio["album"] = [clean_album]
@@ -725,25 +948,34 @@ def normalize_track_metadata(album_path: Path) -> int:
                 audio["title"] = [clean_title]
                 changed = True
 
+        # Apply genre in the same pass
+        if genre and audio.get("genre", [None])[0] != genre:
+            audio["genre"] = [genre]
+            changed = True
+
         if changed:
-            audio.save()
+            audio.save(padding=_metadata_padding)
             modified += 1
 
     return modified
 
 
-def update_genre_from_lastfm(album_path: Path) -> str | None:
-    """Update genre tag using Last.fm artist tags.
+def _fetch_album_genre(
+    album_path: Path, flac_files: list[Path] | None = None
+) -> str | None:
+    """Look up an album's genre from Last.fm artist tags.
 
     Args:
         album_path: Path to album folder.
+        flac_files: Pre-listed FLAC files, to avoid re-globbing.
 
     Returns:
-        The genre that was set, or None if not found.
+        The genre, nicely capitalized, or None if not found.
     """
     from .lastfm import get_artist_top_tag
 
-    flac_files = sorted(album_path.glob("*.flac"))
+    if flac_files is None:
+        flac_files = sorted(album_path.glob("*.flac"))
     if not flac_files:
         return None
 
@@ -759,10 +991,24 @@ def update_genre_from_lastfm(album_path: Path) -> str | None:
         return None
 
     # Capitalize genre nicely (e.g., "rock" -> "Rock", "hip-hop" -> "Hip-Hop")
-    genre = genre.title()
+    return genre.title()
+
+
+def update_genre_from_lastfm(album_path: Path) -> str | None:
+    """Update genre tag using Last.fm artist tags.
+
+    Args:
+        album_path: Path to album folder.
+
+    Returns:
+        The genre that was set, or None if not found.
+    """
+    genre = _fetch_album_genre(album_path)
+    if not genre:
+        return None
 
     # Update all tracks
-    for audio_file in flac_files:
+    for audio_file in sorted(album_path.glob("*.flac")):
         audio = FLAC(audio_file)
         audio["genre"] = [genre]
         audio.save()
@@ -770,21 +1016,25 @@ def update_genre_from_lastfm(album_path: Path) -> str | None:
     return genre
 
 
-def fetch_lyrics_for_album(album_path: Path) -> dict[str, int]:
+def fetch_lyrics_for_album(
+    album_path: Path, flac_files: list[Path] | None = None
+) -> dict[str, int]:
     """Fetch and embed lyrics for all tracks in an album.
 
     Tries LRCLIB first, then falls back to Genius if API key is available.
 
     Args:
         album_path: Path to album folder.
+        flac_files: Pre-listed FLAC files, to avoid re-globbing.
 
     Returns:
         Dict with counts: {"lrclib": n, "genius": n, "not_found": n}
     """
     from .config import GENIUS_API_KEY
-    from .lyrics import get_lyrics
+    from .lyrics import get_lyrics_batch
 
-    flac_files = sorted(album_path.glob("*.flac"))
+    if flac_files is None:
+        flac_files = sorted(album_path.glob("*.flac"))
     if not flac_files:
         return {"lrclib": 0, "genius": 0, "not_found": 0}
 
@@ -793,29 +1043,38 @@ def fetch_lyrics_for_album(album_path: Path) -> dict[str, int]:
     album_name = first_audio.get("album", [None])[0]
 
     result = {"lrclib": 0, "genius": 0, "not_found": 0}
-    genius_key = GENIUS_API_KEY
 
+    # Read all tags up front, then fetch the whole album's lyrics in one
+    # concurrent batch (shared pooled client, bounded fan-out) instead of
+    # one sequential round trip per track
+    audios: list[tuple[Path, FLAC, str | None, str | None]] = []
     for audio_file in flac_files:
         audio = FLAC(audio_file)
         artist = audio.get("artist", audio.get("albumartist", [None]))[0]
         title = audio.get("title", [None])[0]
+        audios.append((audio_file, audio, artist, title))
 
+    wanted = [
+        (artist, title) for _, _, artist, title in audios if artist and title
+    ]
+    lyrics_by_track = get_lyrics_batch(wanted, album_name, GENIUS_API_KEY)
+
+    for audio_file, audio, artist, title in audios:
         if not artist or not title:
             print(f"  {audio_file.stem}: skipped (missing metadata)")
             result["not_found"] += 1
             continue
 
-        print(f"  {title}...", end=" ", flush=True)
-        lyrics, source = get_lyrics(artist, title, album_name, genius_key)
+        lyrics, source = lyrics_by_track[(artist, title)]
 
         if lyrics:
             audio["lyrics"] = [lyrics]
-            audio.save()
+            audio.save(padding=_metadata_padding)
             result[source] += 1
-            print(f"found ({source})")
+            print(f"  {title}... found ({source})")
         else:
             result["not_found"] += 1
-            print("not found")
+            print(f"  {title}... not found")
 
     return result
 
@@ -923,8 +1182,9 @@ def process_album(album_path: Path) -> None:
     """Apply post-processing to an album.
 
     Runs all post-processing steps:
-    - Normalize track metadata (artist, album/track titles, edition markers)
     - Fetch genre from Last.fm
+    - Normalize track metadata (artist, album/track titles, edition
+      markers, genre) in a single pass per file
     - Fetch lyrics from LRCLIB/Genius
     - Embed artwork
     - Apply ReplayGain normalization
@@ -932,22 +1192,28 @@ def process_album(album_path: Path) -> None:
     Args:
         album_path: Path to album folder.
     """
-    # Normalize track metadata (artist, album title, track title)
-    print("Normalizing metadata...", end=" ", flush=True)
-    tracks_modified = normalize_track_metadata(album_path)
-    print(f"done ({tracks_modified} tracks updated)")
+    # List the album's files once; each step below takes the same list
+    flac_files = sorted(album_path.glob("*.flac"))
 
-    # Update genre from Last.fm
+    # Fetch genre first so it can be written in the same per-file pass as
+    # the other metadata edits (one FLAC open/save per track, not two)
     print("Fetching genre...", end=" ", flush=True)
-    genre = update_genre_from_lastfm(album_path)
+    genre = _fetch_album_genre(album_path, flac_files=flac_files)
     if genre:
         print(f"done ({genre})")
     else:
         print("skipped (not found)")
 
+    # Normalize track metadata (artist, album title, track title, genre)
+    print("Normalizing metadata...", end=" ", flush=True)
+    tracks_modified = normalize_track_metadata(
+        album_path, genre=genre, flac_files=flac_files
+    )
+    print(f"done ({tracks_modified} tracks updated)")
+
     # Fetch lyrics
     print("Fetching lyrics...")
-    lyrics_result = fetch_lyrics_for_album(album_path)
+    lyrics_result = fetch_lyrics_for_album(album_path, flac_files=flac_files)
     lrclib_count = lyrics_result.get("lrclib", 0)
     genius_count = lyrics_result.get("genius", 0)
     not_found = lyrics_result.get("not_found", 0)
@@ -6,6 +6,24 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_lookup_caches(tmp_path, monkeypatch):
+    """Give each test its own lookup caches (Last.fm, lyrics, scan).
+
+    Keeps tests from reading or writing the real caches in the user's
+    home directory, and from seeing each other's cached lookups.
+    """
+    monkeypatch.setattr(
+        "music_librarian.lastfm.LASTFM_CACHE_FILE", tmp_path / "lastfm.json"
+    )
+    monkeypatch.setattr(
+        "music_librarian.library.SCAN_CACHE_DIR", tmp_path / "scan-cache"
+    )
+    monkeypatch.setattr("music_librarian.lastfm._memory_cache", {})
+    monkeypatch.setattr("music_librarian.lastfm._negative_cache", {})
+    monkeypatch.setattr("music_librarian.lyrics._memo", {})
+
+
 @pytest.fixture
 def tmp_library(tmp_path):
     """Create a temporary library directory structure."""
@@ -1,6 +1,7 @@
 """Tests for artwork.py image processing."""
 
 import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,12 +12,22 @@ from music_librarian.artwork import (
     COVER_FILENAMES,
     MAX_IMAGE_SIZE,
     MIN_DIMENSION,
+    _best_quality_encode,
+    embed_artwork,
+    embed_artwork_many,
     find_cover_image,
     get_image_data,
     resize_image_to_target,
 )
 
 
+def _create_noisy_image(path: Path, width=800, height=800):
+    """Create a noisy JPEG whose size responds strongly to quality."""
+    img = Image.effect_noise((width, height), 60).convert("RGB")
+    img.save(path, format="JPEG", quality=95)
+    return path
+
+
 def _create_test_image(path: Path, width=100, height=100, fmt="JPEG", size_bytes=None):
     """Create a test image at the given path."""
     img = Image.new("RGB", (width, height), color="red")
@@ -152,3 +163,136 @@ class TestResizeImageToTarget:
         result = Image.open(io.BytesIO(data))
         # Should respect MIN_DIMENSION (500px)
         assert result.width >= MIN_DIMENSION or result.height >= MIN_DIMENSION
+
+
+# --- _best_quality_encode ---
+
+
+class TestBestQualityEncode:
+    def _noisy(self, width=400, height=400):
+        return Image.effect_noise((width, height), 60).convert("RGB")
+
+    def test_high_quality_fits_returns_it(self):
+        img = self._noisy()
+        q95_size = len(_best_quality_encode(img, 10**9)[0])
+        data, q50_size = _best_quality_encode(img, q95_size)
+        assert data is not None
+        assert len(data) == q95_size
+        assert q50_size == 0  # No quality-50 probe was needed
+
+    def test_returns_none_when_quality_floor_too_large(self):
+        img = self._noisy()
+        data, q50_size = _best_quality_encode(img, 100)
+        assert data is None
+        assert q50_size > 100  # Callers size the shrink from this
+
+    def test_fits_cap_across_quality_range(self):
+        # Sweep caps between the q50 and q95 sizes so both the predicted
+        # jump and the overshoot-bisection fallback get exercised
+        img = self._noisy()
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=50)
+        low = buffer.tell()
+        buffer.seek(0)
+        buffer.truncate()
+        img.save(buffer, format="JPEG", quality=95)
+        high = buffer.tell()
+
+        for cap in range(low, high, (high - low) // 8):
+            data, _ = _best_quality_encode(img, cap)
+            assert data is not None
+            assert len(data) <= cap
+
+
+# --- resize contract ---
+
+
+class TestResizeContract:
+    def test_dimensions_preserved_when_quality_reduction_suffices(self, tmp_path):
+        cover = tmp_path / "cover.jpg"
+        _create_noisy_image(cover, 800, 800)
+        # Cap between the q50 and source sizes: quality reduction alone
+        # fits, so the full 800px resolution must survive
+        buffer = io.BytesIO()
+        with Image.open(cover) as img:
+            img.save(buffer, format="JPEG", quality=50)
+        cap = (buffer.tell() + cover.stat().st_size) // 2
+
+        data = resize_image_to_target(cover, cap)
+        result = Image.open(io.BytesIO(data))
+        assert result.size == (800, 800)
+        assert len(data) <= cap
+
+    def test_shrinks_only_when_quality_floor_insufficient(self, tmp_path):
+        cover = tmp_path / "cover.jpg"
+        _create_noisy_image(cover, 800, 800)
+        buffer = io.BytesIO()
+        with Image.open(cover) as img:
+            img.save(buffer, format="JPEG", quality=50)
+        cap = buffer.tell() // 2  # Below the quality floor: must shrink
+
+        data = resize_image_to_target(cover, cap)
+        result = Image.open(io.BytesIO(data))
+        assert len(data) <= cap
+        assert result.width < 800
+        assert result.width >= MIN_DIMENSION
+
+
+# --- embed_artwork / embed_artwork_many ---
+
+
+class TestEmbedArtwork:
+    def _album(self, tmp_path, name, tracks=2, with_cover=True):
+        album = tmp_path / name
+        album.mkdir()
+        if with_cover:
+            _create_test_image(album / "cover.jpg", 100, 100)
+        for i in range(tracks):
+            (album / f"{i + 1:02d} - Track.flac").touch()
+        return album
+
+    @patch("music_librarian.artwork._embed_picture")
+    def test_embeds_cover_in_every_track(self, mock_embed, tmp_path):
+        album = self._album(tmp_path, "a", tracks=3)
+
+        result = embed_artwork(album)
+
+        assert result["cover_found"] is True
+        assert result["tracks_processed"] == 3
+        assert result["was_resized"] is False
+        assert mock_embed.call_count == 3
+        embedded = {call[0][0] for call in mock_embed.call_args_list}
+        assert embedded == set(album.glob("*.flac"))
+
+    @patch("music_librarian.artwork._embed_picture")
+    def test_no_cover_embeds_nothing(self, mock_embed, tmp_path):
+        album = self._album(tmp_path, "a", with_cover=False)
+
+        result = embed_artwork(album)
+
+        assert result["cover_found"] is False
+        assert result["tracks_processed"] == 0
+        mock_embed.assert_not_called()
+
+
+class TestEmbedArtworkMany:
+    # Swap the process pool for threads so the _embed_picture patch
+    # reaches the workers (a mock doesn't survive pickling into a
+    # subprocess); embed_artwork itself runs unmodified
+    @patch("music_librarian.artwork.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("music_librarian.artwork._embed_picture")
+    def test_results_in_input_order(self, mock_embed, tmp_path):
+        albums = [
+            TestEmbedArtwork()._album(tmp_path, "a", tracks=2),
+            TestEmbedArtwork()._album(tmp_path, "b", with_cover=False),
+            TestEmbedArtwork()._album(tmp_path, "c", tracks=1),
+        ]
+
+        results = embed_artwork_many(albums)
+
+        assert [r["cover_found"] for r in results] == [True, False, True]
+        assert [r["tracks_processed"] for r in results] == [2, 0, 1]
+        assert results[0]["cover_path"] == albums[0] / "cover.jpg"
+
+    def test_empty_list(self):
+        assert embed_artwork_many([]) == []
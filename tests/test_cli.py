@@ -7,6 +7,7 @@ import pytest
 from typer.testing import CliRunner
 
 from music_librarian.cli import app, find_album_directories, _parse_interactive_input, _parse_transfer_input
+from music_librarian.qobuz import QobuzAlbum
 
 runner = CliRunner()
 
@@ -461,78 +462,73 @@ class TestShelve:
 
 class TestParseInteractiveInput:
     def test_quit(self):
-        result = _parse_interactive_input("q", 5)
-        assert result == [(0, "q")]
+        assert _parse_interactive_input("q", 5) == (True, [])
 
     def test_quit_case_insensitive(self):
-        result = _parse_interactive_input("Q", 5)
-        assert result == [(0, "q")]
+        assert _parse_interactive_input("Q", 5) == (True, [])
 
     def test_single_index_download(self):
-        result = _parse_interactive_input("2d", 5)
-        assert result == [(2, "d")]
+        assert _parse_interactive_input("2d", 5) == (False, [(2, "d")])
 
     def test_single_index_ignore(self):
-        result = _parse_interactive_input("3i", 5)
-        assert result == [(3, "i")]
+        assert _parse_interactive_input("3i", 5) == (False, [(3, "i")])
 
     def test_single_index_skip(self):
-        result = _parse_interactive_input("1s", 5)
-        assert result == [(1, "s")]
+        assert _parse_interactive_input("1s", 5) == (False, [(1, "s")])
 
     def test_single_index_open(self):
-        result = _parse_interactive_input("2o", 5)
-        assert result == [(2, "o")]
+        assert _parse_interactive_input("2o", 5) == (False, [(2, "o")])
 
     def test_single_index_with_space(self):
-        result = _parse_interactive_input("2 d", 5)
-        assert result == [(2, "d")]
+        assert _parse_interactive_input("2 d", 5) == (False, [(2, "d")])
 
     def test_single_index_no_action(self):
         # Default to skip
-        result = _parse_interactive_input("2", 5)
-        assert result == [(2, "s")]
+        assert _parse_interactive_input("2", 5) == (False, [(2, "s")])
 
     def test_range_download(self):
-        result = _parse_interactive_input("1-3d", 5)
-        assert result == [(1, "d"), (2, "d"), (3, "d")]
+        assert _parse_interactive_input("1-3d", 5) == (
+            False,
+            [(1, "d"), (2, "d"), (3, "d")],
+        )
 
     def test_range_ignore(self):
-        result = _parse_interactive_input("2-4i", 5)
-        assert result == [(2, "i"), (3, "i"), (4, "i")]
+        assert _parse_interactive_input("2-4i", 5) == (
+            False,
+            [(2, "i"), (3, "i"), (4, "i")],
+        )
 
     def test_range_with_spaces(self):
-        result = _parse_interactive_input("1 - 3 d", 5)
-        assert result == [(1, "d"), (2, "d"), (3, "d")]
+        assert _parse_interactive_input("1 - 3 d", 5) == (
+            False,
+            [(1, "d"), (2, "d"), (3, "d")],
+        )
 
     def test_range_no_action(self):
         # Default to skip
-        result = _parse_interactive_input("1-2", 5)
-        assert result == [(1, "s"), (2, "s")]
+        assert _parse_interactive_input("1-2", 5) == (False, [(1, "s"), (2, "s")])
 
     def test_invalid_empty(self):
-        result = _parse_interactive_input("", 5)
-        assert result == []
+        assert _parse_interactive_input("", 5) == (False, [])
 
     def test_invalid_index_too_high(self):
-        result = _parse_interactive_input("10d", 5)
-        assert result == []
+        assert _parse_interactive_input("10d", 5) == (False, [])
 
     def test_invalid_index_zero(self):
-        result = _parse_interactive_input("0d", 5)
-        assert result == []
+        assert _parse_interactive_input("0d", 5) == (False, [])
 
     def test_invalid_range_exceeds_max(self):
-        result = _parse_interactive_input("1-10d", 5)
-        assert result == []
+        assert _parse_interactive_input("1-10d", 5) == (False, [])
 
     def test_invalid_range_reversed(self):
-        result = _parse_interactive_input("5-2d", 5)
-        assert result == []
+        assert _parse_interactive_input("5-2d", 5) == (False, [])
 
     def test_whitespace_handling(self):
-        result = _parse_interactive_input("  2d  ", 5)
-        assert result == [(2, "d")]
+        assert _parse_interactive_input("  2d  ", 5) == (False, [(2, "d")])
+
+    def test_non_ascii_digit_rejected_gracefully(self):
+        # isdigit() accepts "²" but int() raises; must not kill the prompt
+        assert _parse_interactive_input("²", 5) == (False, [])
 
 
 # --- discover command interactive mode ---
@@ -541,7 +537,7 @@ class TestParseInteractiveInput:
 class TestDiscoverInteractive:
     def test_interactive_flag_recognized(self, tmp_library):
         # Just test that the flag is recognized and doesn't error
-        with patch("music_librarian.cli.discover_missing_albums") as mock_discover:
+        with patch("music_librarian.qobuz.discover_missing_albums") as mock_discover:
             mock_discover.return_value = []
             result = runner.invoke(
                 app, ["discover", "-a", "Radiohead", "-I", "-p", str(tmp_library)],
@@ -551,7 +547,7 @@ class TestDiscoverInteractive:
         assert result.exit_code == 0
 
     def test_discover_fuzzy_match(self, tmp_library):
-        with patch("music_librarian.cli.discover_missing_albums") as mock_discover:
+        with patch("music_librarian.qobuz.discover_missing_albums") as mock_discover:
             mock_discover.return_value = []
             result = runner.invoke(
                 app, ["discover", "-a", "Radiohed", "-p", str(tmp_library)]
@@ -618,3 +614,50 @@ class TestParseTransferInput:
     def test_whitespace(self):
         result = _parse_transfer_input("  2s  ", 5)
         assert result == (2, "s")
+
+
+# --- discover ignore filtering ---
+
+
+class TestDiscoverIgnoreFilter:
+    def test_ignored_qobuz_album_is_filtered(self, tmp_library):
+        album = QobuzAlbum(
+            id="1",
+            title="Pablo Honey",
+            year=1993,
+            artist="Radiohead",
+            url="https://qobuz.com/album/1",
+        )
+        with patch("music_librarian.qobuz.discover_missing_albums") as mock_discover, \
+             patch("music_librarian.cli.get_ignored_albums") as mock_ignored:
+            mock_discover.return_value = [album]
+            mock_ignored.return_value = [
+                {"artist": "Radiohead", "album": "Pablo Honey"}
+            ]
+            result = runner.invoke(
+                app, ["discover", "-a", "Radiohead", "-p", str(tmp_library)]
+            )
+
+        assert result.exit_code == 0
+        assert "No new albums found" in result.output
+
+    def test_unignored_qobuz_album_is_shown(self, tmp_library):
+        album = QobuzAlbum(
+            id="1",
+            title="The Bends",
+            year=1995,
+            artist="Radiohead",
+            url="https://qobuz.com/album/1",
+        )
+        with patch("music_librarian.qobuz.discover_missing_albums") as mock_discover, \
+             patch("music_librarian.cli.get_ignored_albums") as mock_ignored:
+            mock_discover.return_value = [album]
+            mock_ignored.return_value = [
+                {"artist": "Radiohead", "album": "Pablo Honey"}
+            ]
+            result = runner.invoke(
+                app, ["discover", "-a", "Radiohead", "-p", str(tmp_library)]
+            )
+
+        assert result.exit_code == 0
+        assert "The Bends" in result.output
@@ -1,6 +1,8 @@
 """Tests for ignore.py CRUD and variant matching."""
 
 import json
+import os
+from unittest.mock import patch
 
 import pytest
 
@@ -11,6 +13,7 @@ from music_librarian.ignore import (
     add_ignored_artist,
     get_ignored_albums,
     get_ignored_artists,
+    ignore_transaction,
     is_album_ignored,
     is_album_ignored_with_variants,
     is_artist_ignored,
@@ -40,6 +43,38 @@ class TestLoadSave:
         assert path.exists()
 
 
+# --- load cache ---
+
+
+class TestLoadCache:
+    def test_repeat_load_skips_reparse(self, tmp_ignore_file):
+        _load_ignore_list(tmp_ignore_file)
+        with patch("music_librarian.ignore.json.load", wraps=json.load) as mock_load:
+            _load_ignore_list(tmp_ignore_file)
+        mock_load.assert_not_called()
+
+    def test_external_edit_invalidates(self, tmp_ignore_file):
+        _load_ignore_list(tmp_ignore_file)
+
+        new_data = {"artists": ["Foo"], "albums": []}
+        tmp_ignore_file.write_text(json.dumps(new_data))
+        # Force a visibly different mtime in case the writes share one
+        st = tmp_ignore_file.stat()
+        os.utime(tmp_ignore_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+        assert _load_ignore_list(tmp_ignore_file) == new_data
+
+    def test_save_refreshes_cache(self, tmp_ignore_file):
+        data = _load_ignore_list(tmp_ignore_file)
+        data["artists"].append("TestArtist")
+        _save_ignore_list(data, tmp_ignore_file)
+
+        with patch("music_librarian.ignore.json.load", wraps=json.load) as mock_load:
+            loaded = _load_ignore_list(tmp_ignore_file)
+        mock_load.assert_not_called()
+        assert "TestArtist" in loaded["artists"]
+
+
 # --- add/remove/get artists ---
 
 
@@ -175,3 +210,50 @@ class TestIsAlbumIgnoredWithVariants:
             for e in data["albums"]
         )
         assert found is False
+
+
+# --- ignore_transaction ---
+
+
+class TestIgnoreTransaction:
+    def test_batches_mutations_into_one_save(self, tmp_ignore_file):
+        with patch(
+            "music_librarian.ignore._save_ignore_list",
+            wraps=_save_ignore_list,
+        ) as mock_save:
+            with ignore_transaction(tmp_ignore_file) as txn:
+                assert txn.add_artist("Nickelback")
+                assert txn.add_album("Radiohead", "Pablo Honey")
+                assert txn.add_album("Creed", "Human Clay")
+        assert mock_save.call_count == 1
+
+        loaded = _load_ignore_list(tmp_ignore_file)
+        assert "Nickelback" in loaded["artists"]
+        assert len(loaded["albums"]) == 2
+
+    def test_deduplicates_within_transaction(self, tmp_ignore_file):
+        with ignore_transaction(tmp_ignore_file) as txn:
+            assert txn.add_artist("Creed")
+            assert not txn.add_artist("CREED")
+            assert txn.add_album("A", "B")
+            assert not txn.add_album("a", "b")
+
+        loaded = _load_ignore_list(tmp_ignore_file)
+        assert loaded["artists"] == ["Creed"]
+        assert len(loaded["albums"]) == 1
+
+    def test_no_save_when_nothing_changed(self, populated_ignore_file):
+        with patch("music_librarian.ignore._save_ignore_list") as mock_save:
+            with ignore_transaction(populated_ignore_file) as txn:
+                assert not txn.add_artist("Nickelback")  # Already present
+        mock_save.assert_not_called()
+
+    def test_removals(self, populated_ignore_file):
+        with ignore_transaction(populated_ignore_file) as txn:
+            assert txn.remove_artist("nickelback")
+            assert txn.remove_album("Radiohead", "Pablo Honey")
+            assert not txn.remove_artist("Unknown")
+
+        loaded = _load_ignore_list(populated_ignore_file)
+        assert "Nickelback" not in loaded["artists"]
+        assert len(loaded["albums"]) == 1
@@ -1,12 +1,17 @@
 """Tests for lastfm.py API integration."""
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import httpx
 import pytest
 import respx
 
+from music_librarian import lastfm
 from music_librarian.lastfm import (
+    LASTFM_CACHE_TTL,
     _call_lastfm_api,
     get_album_listeners,
     get_artist_top_tag,
@@ -96,6 +101,117 @@ class TestGetArtistTopTag:
         assert result is None
 
 
+class TestLastfmCache:
+    @respx.mock
+    def test_listeners_served_from_cache_on_repeat(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            return_value=httpx.Response(200, json={"album": {"listeners": "777"}})
+        )
+        assert get_album_listeners("Artist", "Album", api_key="test_key") == 777
+        assert get_album_listeners("Artist", "Album", api_key="test_key") == 777
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_top_tag_served_from_cache_on_repeat(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            return_value=httpx.Response(
+                200, json={"toptags": {"tag": [{"name": "rock"}]}}
+            )
+        )
+        assert get_artist_top_tag("Radiohead", api_key="test_key") == "rock"
+        assert get_artist_top_tag("Radiohead", api_key="test_key") == "rock"
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_failures_are_not_cached(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            return_value=httpx.Response(500)
+        )
+        assert get_album_listeners("Artist", "Album", api_key="test_key") == 0
+        assert get_album_listeners("Artist", "Album", api_key="test_key") == 0
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_expired_entry_is_refetched(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            return_value=httpx.Response(200, json={"album": {"listeners": "42"}})
+        )
+        stale = {"listeners:artist|album": [5, time.time() - LASTFM_CACHE_TTL - 1]}
+        lastfm.LASTFM_CACHE_FILE.write_text(json.dumps(stale))
+
+        assert get_album_listeners("Artist", "Album", api_key="test_key") == 42
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_corrupt_cache_file_is_ignored(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            return_value=httpx.Response(200, json={"album": {"listeners": "9"}})
+        )
+        lastfm.LASTFM_CACHE_FILE.write_text("not json{")
+
+        assert get_album_listeners("Artist", "Album", api_key="test_key") == 9
+        assert route.call_count == 1
+
+    def test_concurrent_writers_keep_all_entries(self):
+        # rank_albums_by_popularity calls _cache_set from up to 8 threads;
+        # interleaved read-modify-writes must not drop each other's keys
+        keys = [f"listeners:artist|album{i}" for i in range(20)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda k: lastfm._cache_set(k, 1), keys))
+
+        entries = json.loads(lastfm.LASTFM_CACHE_FILE.read_text())
+        assert set(entries) == set(keys)
+        # The temp file from the atomic swap never lingers
+        assert not lastfm.LASTFM_CACHE_FILE.with_suffix(".json.tmp").exists()
+
+
+class TestNegativeCache:
+    @respx.mock
+    def test_timeout_short_circuits_repeat_lookups(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            side_effect=httpx.ReadTimeout("timed out")
+        )
+        assert _call_lastfm_api("album.getinfo", api_key="k", artist="A") is None
+        assert _call_lastfm_api("album.getinfo", api_key="k", artist="A") is None
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_429_honors_retry_after(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "60"})
+        )
+        assert _call_lastfm_api("album.getinfo", api_key="k", artist="A") is None
+        expiry = lastfm._negative_cache[("album.getinfo", "a")]
+        assert expiry - time.monotonic() == pytest.approx(60, abs=5)
+
+        # Still inside the backoff window: no second request
+        assert _call_lastfm_api("album.getinfo", api_key="k", artist="A") is None
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_expired_entry_retries(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            return_value=httpx.Response(200, json={"result": "ok"})
+        )
+        lastfm._negative_cache[("test.method", "")] = time.monotonic() - 1
+        assert _call_lastfm_api("test.method", api_key="k") == {"result": "ok"}
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_other_artists_unaffected(self):
+        route = respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            side_effect=[
+                httpx.ReadTimeout("timed out"),
+                httpx.Response(200, json={"result": "ok"}),
+            ]
+        )
+        assert _call_lastfm_api("album.getinfo", api_key="k", artist="A") is None
+        assert _call_lastfm_api("album.getinfo", api_key="k", artist="B") == {
+            "result": "ok"
+        }
+        assert route.call_count == 2
+
+
 class TestRankAlbumsByPopularity:
     @respx.mock
     def test_ranks_by_listeners_descending(self):
@@ -125,3 +241,25 @@ class TestRankAlbumsByPopularity:
         assert ranked[0][1] == 500  # Album B has most listeners
         assert ranked[1][1] == 200  # Album C second
         assert ranked[2][1] == 100  # Album A last
+
+    def test_empty_album_list(self):
+        assert rank_albums_by_popularity([], "Artist", api_key="test_key") == []
+
+    @respx.mock
+    def test_reuses_one_client_for_the_batch(self):
+        respx.get("https://ws.audioscrobbler.com/2.0/").mock(
+            return_value=httpx.Response(200, json={"album": {"listeners": "1"}})
+        )
+
+        from music_librarian.qobuz import QobuzAlbum
+
+        albums = [
+            QobuzAlbum(id=str(i), title=f"Album {i}", year=2020, artist="A", url="")
+            for i in range(3)
+        ]
+
+        with patch(
+            "music_librarian.lastfm.httpx.Client", wraps=httpx.Client
+        ) as mock_client:
+            rank_albums_by_popularity(albums, "A", api_key="test_key")
+        assert mock_client.call_count == 1
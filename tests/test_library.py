@@ -1,21 +1,27 @@
 """Tests for library.py parsing and normalization."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from music_librarian.library import (
     Album,
     Artist,
+    build_artist_index,
     check_volume_mounted,
+    find_artist_with_suggestions,
     find_matching_artist,
+    find_matching_artists,
     get_artist_path,
     get_artist_search_variants,
     get_letter_for_artist,
+    iter_library_artists,
     normalize_artist,
     parse_album_folder,
     parse_new_folder,
     scan_library,
+    scan_library_cached,
 )
 
 
@@ -118,6 +124,38 @@ class TestGetLetterForArtist:
         assert get_letter_for_artist("") == "A"
 
 
+# --- Album / Artist lowercase fields ---
+
+
+class TestLowercaseFields:
+    def test_album_lower_title_populated(self):
+        album = Album(year=1997, title="OK Computer", path=Path("/x"))
+        assert album.lower_title == "ok computer"
+
+    def test_artist_lower_name_populated(self):
+        artist = Artist(
+            name="The Beatles", canonical_name="Beatles", albums=[], path=Path("/x")
+        )
+        assert artist.lower_name == "the beatles"
+
+
+# --- iter_library_artists ---
+
+
+class TestIterLibraryArtists:
+    def test_yields_same_artists_as_scan_library(self, tmp_library):
+        streamed = {a.name: a for a in iter_library_artists(tmp_library)}
+        assert streamed == scan_library(tmp_library)
+
+    def test_is_lazy(self, tmp_library):
+        iterator = iter_library_artists(tmp_library)
+        first = next(iterator)
+        assert first.albums  # First artist available without a full walk
+
+    def test_nonexistent_path_yields_nothing(self, tmp_path):
+        assert list(iter_library_artists(tmp_path / "missing")) == []
+
+
 # --- scan_library ---
 
 
@@ -176,6 +214,54 @@ class TestScanLibrary:
         assert artists["Beatles"].path == tmp_library / "B" / "Beatles"
 
 
+# --- scan_library_cached ---
+
+
+class TestScanLibraryCached:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        cache = tmp_path / "cache"
+        monkeypatch.setattr("music_librarian.library.SCAN_CACHE_DIR", cache)
+        return cache
+
+    def test_matches_uncached_scan(self, tmp_library):
+        assert scan_library_cached(tmp_library) == scan_library(tmp_library)
+
+    def test_second_call_uses_cache(self, tmp_library):
+        scan_library_cached(tmp_library)
+        with patch(
+            "music_librarian.library.scan_library", wraps=scan_library
+        ) as mock_scan:
+            result = scan_library_cached(tmp_library)
+            mock_scan.assert_not_called()
+        assert "Beatles" in result
+
+    def test_library_change_invalidates_cache(self, tmp_library):
+        scan_library_cached(tmp_library)
+        (tmp_library / "R" / "Radiohead" / "[2007] In Rainbows").mkdir()
+        result = scan_library_cached(tmp_library)
+        years = {a.year for a in result["Radiohead"].albums}
+        assert 2007 in years
+
+    def test_refresh_bypasses_cache(self, tmp_library):
+        scan_library_cached(tmp_library)
+        with patch(
+            "music_librarian.library.scan_library", wraps=scan_library
+        ) as mock_scan:
+            scan_library_cached(tmp_library, refresh=True)
+            mock_scan.assert_called_once()
+
+    def test_corrupt_cache_falls_back_to_scan(self, tmp_library, cache_dir):
+        scan_library_cached(tmp_library)
+        for cache_file in cache_dir.glob("scan-*.pkl"):
+            cache_file.write_bytes(b"not a pickle")
+        result = scan_library_cached(tmp_library)
+        assert "Beatles" in result
+
+    def test_nonexistent_path_returns_empty(self, tmp_path):
+        assert scan_library_cached(tmp_path / "nonexistent") == {}
+
+
 # --- get_artist_path ---
 
 
@@ -280,3 +366,64 @@ class TestFindMatchingArtist:
         assert find_matching_artist("Radiohea", artists, threshold=99) is None
         # Lower threshold should accept
         assert find_matching_artist("Radiohea", artists, threshold=80) == "Radiohead"
+
+
+# --- build_artist_index / find_matching_artists ---
+
+
+class TestBuildArtistIndex:
+    def test_maps_lowercase_to_original(self):
+        lower, mapping = build_artist_index(["Radiohead", "The Beatles"])
+        assert lower == ["radiohead", "the beatles"]
+        assert mapping["the beatles"] == "The Beatles"
+
+    def test_cached_across_calls(self):
+        artists = ["Radiohead", "The Beatles"]
+        assert build_artist_index(artists) is build_artist_index(list(artists))
+
+
+class TestFindMatchingArtists:
+    def test_matches_batch(self):
+        artists = ["Radiohead", "The Beatles", "Pink Floyd"]
+        results = find_matching_artists(["Radiohed", "beatles", "Nope Nope"], artists)
+        assert results == {
+            "Radiohed": "Radiohead",
+            "beatles": "The Beatles",
+            "Nope Nope": None,
+        }
+
+    def test_empty_artist_list(self):
+        assert find_matching_artists(["Radiohead"], []) == {"Radiohead": None}
+
+
+# --- find_artist_with_suggestions ---
+
+
+class TestFindArtistWithSuggestions:
+    def test_good_match_returned(self):
+        match, suggestions = find_artist_with_suggestions(
+            "Radiohed", ["Radiohead", "Beatles", "Pink Floyd"]
+        )
+        assert match == "Radiohead"
+        assert suggestions == []
+
+    def test_case_insensitive(self):
+        match, _ = find_artist_with_suggestions("RADIOHEAD", ["Radiohead"])
+        assert match == "Radiohead"
+
+    def test_no_match_gives_suggestions(self):
+        match, suggestions = find_artist_with_suggestions(
+            "Zzyzx", ["Radiohead", "Beatles", "Pink Floyd", "Talking Heads"]
+        )
+        assert match is None
+        assert len(suggestions) == 3
+
+    def test_empty_artists(self):
+        match, suggestions = find_artist_with_suggestions("Radiohead", [])
+        assert match is None
+        assert suggestions == []
+
+    def test_accepts_dict_keys(self):
+        artists = {"Radiohead": object(), "Beatles": object()}
+        match, _ = find_artist_with_suggestions("Beatles", artists.keys())
+        assert match == "Beatles"
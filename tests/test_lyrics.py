@@ -8,6 +8,7 @@ import respx
 
 from music_librarian.lyrics import (
     get_lyrics,
+    get_lyrics_batch,
     get_lyrics_from_genius,
     get_lyrics_from_lrclib,
 )
@@ -219,3 +220,40 @@ class TestGetLyrics:
         lyrics, source = get_lyrics("Artist", "Song", genius_api_key=None)
         assert lyrics is None
         assert source == "none"
+
+
+# --- get_lyrics_batch ---
+
+
+class TestGetLyricsBatch:
+    def test_empty_batch(self):
+        with patch("music_librarian.lyrics.httpx.Client") as mock_client:
+            assert get_lyrics_batch([]) == {}
+        mock_client.assert_not_called()
+
+    @respx.mock
+    def test_fetches_all_tracks(self):
+        respx.get("https://lrclib.net/api/get").mock(
+            return_value=httpx.Response(
+                200, json={"plainLyrics": "la la", "syncedLyrics": None}
+            )
+        )
+        tracks = [("Artist", "One"), ("Artist", "Two")]
+        results = get_lyrics_batch(tracks, album="Album")
+        assert results == {
+            ("Artist", "One"): ("la la", "lrclib"),
+            ("Artist", "Two"): ("la la", "lrclib"),
+        }
+
+    @respx.mock
+    def test_reuses_one_client_for_the_batch(self):
+        respx.get("https://lrclib.net/api/get").mock(
+            return_value=httpx.Response(
+                200, json={"plainLyrics": "la la", "syncedLyrics": None}
+            )
+        )
+        with patch(
+            "music_librarian.lyrics.httpx.Client", wraps=httpx.Client
+        ) as mock_client:
+            get_lyrics_batch([("Artist", "One"), ("Artist", "Two")])
+        assert mock_client.call_count == 1
@@ -1,11 +1,12 @@
 """Tests for normalize.py subprocess wrapper."""
 
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from music_librarian.normalize import normalize_album
+from music_librarian.normalize import normalize_album, normalize_albums
 
 
 class TestNormalizeAlbum:
@@ -95,3 +96,108 @@ class TestNormalizeAlbum:
         assert "-a" in call_args
         assert "-s" in call_args
         assert "i" in call_args
+
+
+class TestNormalizeAlbums:
+    def _album(self, tmp_path, name):
+        album = tmp_path / name
+        album.mkdir()
+        (album / "01.flac").touch()
+        return album
+
+    def test_raises_on_missing_path(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            normalize_albums([tmp_path / "nonexistent"])
+
+    def test_empty_list_spawns_nothing(self):
+        with patch("music_librarian.normalize.subprocess.run") as mock_run:
+            assert normalize_albums([]) == {}
+        mock_run.assert_not_called()
+
+    @patch("music_librarian.normalize.subprocess.run")
+    def test_easy_mode_one_directory_per_invocation(self, mock_run, tmp_path):
+        a = self._album(tmp_path, "a")
+        b = self._album(tmp_path, "b")
+
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        normalize_albums([a, b])
+        assert mock_run.call_count == 2
+        for call, album in zip(mock_run.call_args_list, [a, b]):
+            call_args = call[0][0]
+            assert call_args[:2] == ["rsgain", "easy"]
+            assert "-m" in call_args
+            # Easy mode's contract is a single DIRECTORY argument
+            assert call_args[-1] == str(album)
+
+    @patch("music_librarian.normalize.subprocess.run")
+    def test_parses_each_albums_output(self, mock_run, tmp_path):
+        a = self._album(tmp_path, "a")
+        b = self._album(tmp_path, "b")
+
+        mock_run.side_effect = [
+            MagicMock(
+                returncode=0,
+                stdout=(
+                    "Album:\n"
+                    "  Loudness:   -15.20 LUFS\n"
+                    "  Peak:     0.980000 (-0.18 dB)\n"
+                    "  Gain:       2.80 dB\n"
+                ),
+                stderr="",
+            ),
+            MagicMock(
+                returncode=0,
+                stdout=(
+                    "Album:\n"
+                    "  Loudness:   -10.10 LUFS\n"
+                    "  Peak:     0.900000 (-0.92 dB)\n"
+                    "  Gain:      -1.40 dB\n"
+                ),
+                stderr="",
+            ),
+        ]
+
+        results = normalize_albums([a, b])
+        assert results[a]["gain"] == pytest.approx(2.80)
+        assert results[b]["loudness"] == pytest.approx(-10.10)
+
+    @patch("music_librarian.normalize.subprocess.run")
+    def test_missing_figures_map_to_none(self, mock_run, tmp_path):
+        a = self._album(tmp_path, "a")
+        b = self._album(tmp_path, "b")
+
+        mock_run.side_effect = [
+            MagicMock(
+                returncode=0,
+                stdout=(
+                    "Album:\n"
+                    "  Loudness:   -15.20 LUFS\n"
+                    "  Peak:     0.980000 (-0.18 dB)\n"
+                    "  Gain:       2.80 dB\n"
+                ),
+                stderr="",
+            ),
+            MagicMock(returncode=0, stdout="", stderr=""),
+        ]
+
+        results = normalize_albums([a, b])
+        assert results[a] is not None
+        assert results[b] is None
+
+    @patch("music_librarian.normalize.subprocess.run")
+    def test_rsgain_failure_raises_with_stderr(self, mock_run, tmp_path):
+        a = self._album(tmp_path, "a")
+        b = self._album(tmp_path, "b")
+
+        mock_run.side_effect = [
+            MagicMock(returncode=1, stdout="", stderr="boom"),
+            MagicMock(returncode=0, stdout="", stderr=""),
+        ]
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            normalize_albums([a, b])
+
+        assert exc_info.value.stderr == "boom"
+        # The failure surfaces only after the rest of the batch ran
+        assert mock_run.call_count == 2
@@ -2,10 +2,14 @@
 
 import configparser
 from pathlib import Path
+from unittest.mock import patch
 
+import httpx
 import pytest
+import respx
 
 from music_librarian.qobuz import (
+    discover_missing_albums,
     QobuzAlbum,
     _deduplicate_albums,
     _extract_edition_markers,
@@ -58,6 +62,9 @@ class TestIsCompilationOrLive:
             "Acoustic Live Sessions",
             "Stop Making Sense",
             "The Name of This Band Is Talking Heads",
+            # Runs of whitespace must not slip past the trigger prefilter
+            "Stop Making  Sense",
+            "The Name of This  Band Is Talking Heads",
         ],
     )
     def test_live_albums_detected(self, title):
@@ -196,6 +203,10 @@ class TestStripEditionMarkers:
     def test_strips_and_more(self):
         assert _strip_edition_markers("Album ...and more") == "Album"
 
+    def test_strips_and_more_with_extra_whitespace(self):
+        # \s+ in the pattern; must not slip past the trigger prefilter
+        assert _strip_edition_markers("Album ...and  more") == "Album"
+
     def test_strips_stereo_mono(self):
         assert _strip_edition_markers("Album (Stereo)") == "Album"
         assert _strip_edition_markers("Album (Mono)") == "Album"
@@ -492,3 +503,61 @@ class TestGetQobuzCredentials:
 
         with pytest.raises(ValueError):
             get_qobuz_credentials(config_path)
+
+
+# --- discover_missing_albums ---
+
+class TestDiscoverMissingAlbums:
+    def _mock_api(self):
+        respx.get("https://www.qobuz.com/api.json/0.2/artist/search").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "artists": {"items": [{"id": 123, "name": "Radiohead"}]}
+                },
+            )
+        )
+        respx.get("https://www.qobuz.com/api.json/0.2/artist/get").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "albums": {
+                        "items": [
+                            {
+                                "id": "a1",
+                                "title": "The Bends",
+                                "release_date_original": "1995-03-13",
+                                "artist": {"id": 123, "name": "Radiohead"},
+                                "url": "",
+                                "tracks_count": 12,
+                            }
+                        ]
+                    }
+                },
+            )
+        )
+
+    @respx.mock
+    def test_returns_albums_not_in_library(self):
+        self._mock_api()
+        with patch(
+            "music_librarian.qobuz.get_qobuz_credentials",
+            return_value=("app", "secret"),
+        ):
+            missing = discover_missing_albums("Radiohead", [(2000, "Kid A")])
+
+        assert [a.title for a in missing] == ["The Bends"]
+
+    @respx.mock
+    def test_shares_one_client_across_calls(self):
+        self._mock_api()
+        with patch(
+            "music_librarian.qobuz.get_qobuz_credentials",
+            return_value=("app", "secret"),
+        ), patch(
+            "music_librarian.qobuz.httpx.Client", wraps=httpx.Client
+        ) as client_cls:
+            discover_missing_albums("Radiohead", [])
+
+        # The search and the album fetch ride one pooled connection
+        assert client_cls.call_count == 1